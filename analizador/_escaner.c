@@ -0,0 +1,253 @@
+/*
+ * Núcleo nativo de extracción de lexemas para analizador.escaner.
+ *
+ * escanear(linea, inicio, tabla) recorre la línea desde la posición inicio
+ * con las mismas reglas que Lexico._obtener_siguiente_lexema y devuelve una
+ * lista de tuplas (tipo, inicio, fin). tabla es cualquier contenedor de
+ * lexemas (normalmente el índice de la tabla de símbolos) que se consulta
+ * con los pares de dos caracteres.
+ *
+ * recorrer(linea, inicio, tabla) aplica las mismas reglas de a un lexema
+ * por iteración, consultando la tabla en ese momento.
+ *
+ * Las palabras y cadenas se clasifican con las reglas de Automatas:
+ * IDENTIFICADOR y NUMERO para las palabras que lo son, CADENA para las
+ * cadenas cerradas y CADENA_ABIERTA para las que no cierran. PALABRA queda
+ * para el resto, que se clasifica en Python.
+ *
+ * Compilación: python setup.py build_ext --inplace
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+enum {
+    DOS_CARACTERES = 0,
+    OPERADOR = 1,
+    CADENA = 2,
+    PALABRA = 3,
+    IDENTIFICADOR = 4,
+    NUMERO = 5,
+    CADENA_ABIERTA = 6
+};
+
+static int
+es_operador(Py_UCS4 c)
+{
+    switch (c) {
+    case '+': case '-': case '*': case '/': case '=': case '.': case ',':
+    case ':': case '(': case ')': case '{': case '}': case '&': case '|':
+    case '<': case '>': case ';':
+        return 1;
+    default:
+        return 0;
+    }
+}
+
+/*
+ * Corta el lexema que empieza en la posición *i o después (tras saltar
+ * espacios). Devuelve 1 si encontró un lexema, 0 al final de la línea y
+ * -1 si hubo un error de Python. La tabla se consulta en cada llamada, de
+ * modo que los lexemas agregados entre llamadas se respetan.
+ */
+static int
+siguiente_token(PyObject *linea, Py_ssize_t *i, PyObject *tabla,
+                int *tipo, Py_ssize_t *inicio, Py_ssize_t *fin)
+{
+    Py_ssize_t n = PyUnicode_GET_LENGTH(linea);
+    int kind = PyUnicode_KIND(linea);
+    const void *datos = PyUnicode_DATA(linea);
+    Py_ssize_t j = *i;
+
+    while (j < n && Py_UNICODE_ISSPACE(PyUnicode_READ(kind, datos, j))) {
+        j++;
+    }
+    if (j >= n) {
+        *i = n;
+        return 0;
+    }
+
+    Py_UCS4 c = PyUnicode_READ(kind, datos, j);
+    *inicio = j;
+    if (j < n - 1) {
+        PyObject *par = PyUnicode_Substring(linea, j, j + 2);
+        if (par == NULL) {
+            return -1;
+        }
+        int encontrado = PySequence_Contains(tabla, par);
+        Py_DECREF(par);
+        if (encontrado < 0) {
+            return -1;
+        }
+        if (encontrado) {
+            *tipo = DOS_CARACTERES;
+            *fin = *i = j + 2;
+            return 1;
+        }
+    }
+
+    Py_ssize_t k;
+    if (es_operador(c)) {
+        *tipo = OPERADOR;
+        k = j + 1;
+    }
+    else if (c == '"') {
+        k = j + 1;
+        while (k < n && PyUnicode_READ(kind, datos, k) != '"') {
+            k++;
+        }
+        /* Una comilla sola al final de la línea empieza y termina con '"' */
+        *tipo = (k < n || k == j + 1) ? CADENA : CADENA_ABIERTA;
+        if (k < n) {
+            k++;
+        }
+    }
+    else {
+        /* Autómatas de Automatas.isIdentificador e isNumero en un solo recorrido */
+        int identificador = Py_UNICODE_ISALPHA(c) || c == '_';
+        int numero = Py_UNICODE_ISDIGIT(c);
+        k = j;
+        while (k < n) {
+            Py_UCS4 d = PyUnicode_READ(kind, datos, k);
+            if (Py_UNICODE_ISSPACE(d) || es_operador(d) || d == '"') {
+                break;
+            }
+            if (k > j) {
+                identificador = identificador && (Py_UNICODE_ISALNUM(d) || d == '_');
+                numero = numero && Py_UNICODE_ISDIGIT(d);
+            }
+            k++;
+        }
+        *tipo = identificador ? IDENTIFICADOR : numero ? NUMERO : PALABRA;
+    }
+    *fin = *i = k;
+    return 1;
+}
+
+static PyObject *
+escanear(PyObject *modulo, PyObject *args)
+{
+    PyObject *linea;
+    Py_ssize_t i;
+    PyObject *tabla;
+
+    if (!PyArg_ParseTuple(args, "UnO:escanear", &linea, &i, &tabla)) {
+        return NULL;
+    }
+
+    PyObject *tokens = PyList_New(0);
+    if (tokens == NULL) {
+        return NULL;
+    }
+    if (i < 0) {
+        i = 0;
+    }
+
+    int tipo;
+    Py_ssize_t inicio, fin;
+    int resultado;
+    while ((resultado = siguiente_token(linea, &i, tabla, &tipo, &inicio, &fin)) > 0) {
+        PyObject *token = Py_BuildValue("(inn)", tipo, inicio, fin);
+        if (token == NULL || PyList_Append(tokens, token) < 0) {
+            Py_XDECREF(token);
+            Py_DECREF(tokens);
+            return NULL;
+        }
+        Py_DECREF(token);
+    }
+    if (resultado < 0) {
+        Py_DECREF(tokens);
+        return NULL;
+    }
+    return tokens;
+}
+
+/*
+ * Cursor reanudable: cada iteración corta un solo lexema con la tabla
+ * vigente, así que agregar un lexema a la tabla no obliga a reescanear.
+ */
+typedef struct {
+    PyObject_HEAD
+    PyObject *linea;
+    PyObject *tabla;
+    Py_ssize_t posicion;
+} Recorrido;
+
+static void
+recorrido_dealloc(Recorrido *self)
+{
+    Py_XDECREF(self->linea);
+    Py_XDECREF(self->tabla);
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *
+recorrido_next(Recorrido *self)
+{
+    int tipo;
+    Py_ssize_t inicio, fin;
+    int resultado = siguiente_token(self->linea, &self->posicion, self->tabla,
+                                    &tipo, &inicio, &fin);
+    if (resultado <= 0) {
+        return NULL;
+    }
+    return Py_BuildValue("(inn)", tipo, inicio, fin);
+}
+
+static PyTypeObject RecorridoTipo = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "analizador._escaner.Recorrido",
+    .tp_basicsize = sizeof(Recorrido),
+    .tp_dealloc = (destructor)recorrido_dealloc,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_doc = "Cursor de lexemas de una línea.",
+    .tp_iter = PyObject_SelfIter,
+    .tp_iternext = (iternextfunc)recorrido_next,
+};
+
+static PyObject *
+recorrer(PyObject *modulo, PyObject *args)
+{
+    PyObject *linea;
+    Py_ssize_t i;
+    PyObject *tabla;
+
+    if (!PyArg_ParseTuple(args, "UnO:recorrer", &linea, &i, &tabla)) {
+        return NULL;
+    }
+    Recorrido *recorrido = PyObject_New(Recorrido, &RecorridoTipo);
+    if (recorrido == NULL) {
+        return NULL;
+    }
+    Py_INCREF(linea);
+    Py_INCREF(tabla);
+    recorrido->linea = linea;
+    recorrido->tabla = tabla;
+    recorrido->posicion = i < 0 ? 0 : i;
+    return (PyObject *)recorrido;
+}
+
+static PyMethodDef metodos[] = {
+    {"escanear", escanear, METH_VARARGS,
+     "escanear(linea, inicio, tabla) -> lista de (tipo, inicio, fin)"},
+    {"recorrer", recorrer, METH_VARARGS,
+     "recorrer(linea, inicio, tabla) -> iterador de (tipo, inicio, fin)"},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef modulo = {
+    PyModuleDef_HEAD_INIT,
+    "_escaner",
+    "Núcleo nativo de extracción de lexemas.",
+    -1,
+    metodos
+};
+
+PyMODINIT_FUNC
+PyInit__escaner(void)
+{
+    if (PyType_Ready(&RecorridoTipo) < 0) {
+        return NULL;
+    }
+    return PyModule_Create(&modulo);
+}
@@ -0,0 +1,340 @@
+"""
+Pruebas diferenciales entre motores léxicos.
+
+Un motor es cualquier fábrica (callable sin argumentos) que devuelve un
+objeto con la interfaz de Lexico: analizarLinea(linea), obtener_log_salida()
+y obtener_tabla_simbolos(). El Lexico actual se usa como oráculo de
+referencia y las salidas deben coincidir byte a byte.
+
+Uso:
+    python -m analizador.diferencial modulo:Fabrica [--casos N] [--semilla S]
+"""
+
+import argparse
+import functools
+import importlib
+import random
+import time
+
+from analizador.lexico import Lexico
+
+
+# El oráculo usa siempre el recorrido en Python, aunque el escáner nativo esté compilado
+REFERENCIA = functools.partial(Lexico, acelerado=False)
+
+
+PALABRAS = ['programa', 'int', 'char', 'float', 'leer', 'imprimir', 'terminar',
+            'mientras', 'si', 'sino']
+OPERADORES = ['+', '-', '*', '/', '=', '.', ',', ':', '(', ')', '{', '}',
+              '&', '&&', '|', '||', '<', '>', ';']
+IDENTIFICADORES = ['a', 'b', 'c', 'x1', '_tmp', 'suma', 'ab', 'sin', 'si2', 'leerx']
+NUMEROS = ['0', '5', '42', '007', '.5', '5.', '3.14', '1.2.3', '..', '5a', '1e5']
+CADENAS = ['"hola"', '""', '"a b c"', '"sin cerrar', '"con ; y +"']
+RAROS = ['@', '#', '$', '!', '?', '[', ']', '\\', 'ñ', 'é', "'", '~', '\u00a0', '\x1f', '\u3000']
+ESPACIOS = [' ', ' ', ' ', '  ', '\t', '']
+
+
+class Divergencia:
+    """Describe la primera diferencia encontrada entre dos motores."""
+
+    def __init__(self, lineas, indice, esperado, obtenido, reproductor,
+                 indice_tabla=None, simbolo_esperado=None, simbolo_obtenido=None):
+        """
+        Inicializa la divergencia.
+
+        Args:
+            lineas (list): Entrada original que produjo la diferencia
+            indice (int): Posición de la primera entrada del log distinta
+                (la longitud del log si solo difieren las tablas)
+            esperado (str or None): Entrada del motor de referencia
+            obtenido (str or None): Entrada del motor alternativo
+            reproductor (list): Entrada minimizada que sigue divergiendo
+            indice_tabla (int, optional): Posición del primer símbolo distinto,
+                None si las tablas coinciden
+            simbolo_esperado (tuple, optional): (token, lexema) de la referencia
+            simbolo_obtenido (tuple, optional): (token, lexema) del alternativo
+        """
+        self.lineas = lineas
+        self.indice = indice
+        self.esperado = esperado
+        self.obtenido = obtenido
+        self.reproductor = reproductor
+        self.indice_tabla = indice_tabla
+        self.simbolo_esperado = simbolo_esperado
+        self.simbolo_obtenido = simbolo_obtenido
+
+    def __str__(self):
+        partes = []
+        if self.esperado != self.obtenido:
+            partes.append(f"Divergencia en la entrada {self.indice} del log:\n"
+                          f"  referencia:  {self.esperado!r}\n"
+                          f"  alternativo: {self.obtenido!r}")
+        if self.indice_tabla is not None:
+            partes.append(f"Divergencia en el símbolo {self.indice_tabla} de la tabla:\n"
+                          f"  referencia:  {self.simbolo_esperado!r}\n"
+                          f"  alternativo: {self.simbolo_obtenido!r}")
+        partes.append(f"  reproductor: {self.reproductor!r}")
+        return '\n'.join(partes)
+
+
+class ResultadoDiferencial:
+    """Resultado de comparar dos motores sobre un conjunto de casos."""
+
+    def __init__(self, casos, bytes_totales, tiempo_referencia, tiempo_alternativo, divergencia):
+        """
+        Inicializa el resultado.
+
+        Args:
+            casos (int): Casos ejecutados
+            bytes_totales (int): Bytes de entrada analizados por cada motor
+            tiempo_referencia (float): Segundos del motor de referencia
+            tiempo_alternativo (float): Segundos del motor alternativo
+            divergencia (Divergencia or None): Primera divergencia encontrada
+        """
+        self.casos = casos
+        self.bytes_totales = bytes_totales
+        self.tiempo_referencia = tiempo_referencia
+        self.tiempo_alternativo = tiempo_alternativo
+        self.divergencia = divergencia
+
+    def resumen(self):
+        """
+        Genera un resumen legible del resultado.
+
+        Returns:
+            str: Resumen con casos, tiempos y la divergencia si la hay
+        """
+        texto = (f"Casos: {self.casos}, bytes: {self.bytes_totales}\n"
+                 f"Referencia:  {self.tiempo_referencia:.4f} s\n"
+                 f"Alternativo: {self.tiempo_alternativo:.4f} s")
+        if self.divergencia:
+            return texto + "\n" + str(self.divergencia)
+        return texto + "\nSin divergencias"
+
+
+def generar_linea(rng):
+    """
+    Genera una línea aleatoria mezclando tokens válidos y casos límite.
+
+    Args:
+        rng (random.Random): Generador de números aleatorios
+
+    Returns:
+        str: Línea generada
+    """
+    grupos = [PALABRAS, OPERADORES, OPERADORES, IDENTIFICADORES, NUMEROS, CADENAS, RAROS]
+    partes = []
+    for _ in range(rng.randint(0, 12)):
+        partes.append(rng.choice(rng.choice(grupos)))
+        partes.append(rng.choice(ESPACIOS))
+    return ''.join(partes)
+
+
+def mutar_linea(rng, linea):
+    """
+    Aplica una mutación aleatoria de un carácter a una línea.
+
+    Args:
+        rng (random.Random): Generador de números aleatorios
+        linea (str): Línea a mutar
+
+    Returns:
+        str: Línea mutada
+    """
+    alfabeto = 'ab_19.+-*/=,:(){}&|<>;" \t@ñ'
+    posicion = rng.randint(0, len(linea))
+    operacion = rng.randrange(3)
+    if operacion == 0 or not linea:
+        return linea[:posicion] + rng.choice(alfabeto) + linea[posicion:]
+    posicion = min(posicion, len(linea) - 1)
+    if operacion == 1:
+        return linea[:posicion] + linea[posicion + 1:]
+    return linea[:posicion] + rng.choice(alfabeto) + linea[posicion + 1:]
+
+
+def generar_caso(rng, max_lineas=8):
+    """
+    Genera un programa aleatorio, con mutaciones en algunas líneas.
+
+    Args:
+        rng (random.Random): Generador de números aleatorios
+        max_lineas (int): Máximo de líneas del programa
+
+    Returns:
+        list: Líneas del programa
+    """
+    lineas = []
+    for _ in range(rng.randint(1, max_lineas)):
+        linea = generar_linea(rng)
+        while rng.random() < 0.3:
+            linea = mutar_linea(rng, linea)
+        lineas.append(linea)
+    return lineas
+
+
+def ejecutar_motor(fabrica, lineas):
+    """
+    Analiza las líneas con un motor nuevo.
+
+    Args:
+        fabrica (callable): Fábrica del motor
+        lineas (list): Líneas a analizar
+
+    Returns:
+        tuple: (log de salida, tabla como lista de (token, lexema), segundos)
+    """
+    motor = fabrica()
+    inicio = time.perf_counter()
+    for linea in lineas:
+        motor.analizarLinea(linea)
+    transcurrido = time.perf_counter() - inicio
+    log_salida = list(motor.obtener_log_salida())
+    tabla = [(s.token, s.lexema) for s in motor.obtener_tabla_simbolos()]
+    return log_salida, tabla, transcurrido
+
+
+def primera_divergencia(esperado, obtenido):
+    """
+    Busca la primera entrada distinta entre dos logs.
+
+    Args:
+        esperado (list): Log del motor de referencia
+        obtenido (list): Log del motor alternativo
+
+    Returns:
+        int or None: Índice de la primera diferencia, None si son iguales
+    """
+    for indice, (a, b) in enumerate(zip(esperado, obtenido)):
+        if a != b:
+            return indice
+    if len(esperado) != len(obtenido):
+        return min(len(esperado), len(obtenido))
+    return None
+
+
+def _divergen(fabrica_referencia, fabrica_alternativa, lineas):
+    log_ref, tabla_ref, _ = ejecutar_motor(fabrica_referencia, lineas)
+    log_alt, tabla_alt, _ = ejecutar_motor(fabrica_alternativa, lineas)
+    return log_ref != log_alt or tabla_ref != tabla_alt
+
+
+def minimizar(lineas, divergen):
+    """
+    Reduce una entrada que diverge eliminando líneas y luego caracteres
+    mientras la divergencia se mantenga (delta debugging simplificado).
+
+    Args:
+        lineas (list): Entrada que diverge
+        divergen (callable): Recibe una lista de líneas y devuelve True si diverge
+
+    Returns:
+        list: Entrada minimizada
+    """
+    actual = list(lineas)
+
+    tamano = max(len(actual) // 2, 1)
+    while tamano >= 1:
+        i = 0
+        while i < len(actual):
+            candidato = actual[:i] + actual[i + tamano:]
+            if candidato and divergen(candidato):
+                actual = candidato
+            else:
+                i += tamano
+        tamano //= 2
+
+    for n in range(len(actual)):
+        tamano = max(len(actual[n]) // 2, 1)
+        while tamano >= 1:
+            i = 0
+            while i < len(actual[n]):
+                linea = actual[n][:i] + actual[n][i + tamano:]
+                candidato = actual[:n] + [linea] + actual[n + 1:]
+                if divergen(candidato):
+                    actual = candidato
+                else:
+                    i += tamano
+            tamano //= 2
+
+    return actual
+
+
+def comparar_motores(fabrica_alternativa, fabrica_referencia=REFERENCIA, casos=500, semilla=0, entradas=None):
+    """
+    Compara un motor alternativo con el de referencia sobre entradas dadas
+    y casos generados, deteniéndose en la primera divergencia.
+
+    Args:
+        fabrica_alternativa (callable): Fábrica del motor a verificar
+        fabrica_referencia (callable): Fábrica del oráculo (Lexico en Python por defecto)
+        casos (int): Cantidad de casos aleatorios a generar
+        semilla (int): Semilla del generador
+        entradas (list, optional): Listas de líneas a probar antes de las generadas
+
+    Returns:
+        ResultadoDiferencial: Tiempos de ambos motores y la divergencia, si la hay
+    """
+    rng = random.Random(semilla)
+    conjunto = list(entradas or [])
+    conjunto.extend(generar_caso(rng) for _ in range(casos))
+
+    tiempo_referencia = 0.0
+    tiempo_alternativo = 0.0
+    bytes_totales = 0
+    for numero, lineas in enumerate(conjunto, 1):
+        log_ref, tabla_ref, t_ref = ejecutar_motor(fabrica_referencia, lineas)
+        log_alt, tabla_alt, t_alt = ejecutar_motor(fabrica_alternativa, lineas)
+        tiempo_referencia += t_ref
+        tiempo_alternativo += t_alt
+        bytes_totales += sum(len(linea) for linea in lineas)
+
+        indice = primera_divergencia(log_ref, log_alt)
+        if indice is None and tabla_ref == tabla_alt:
+            continue
+        if indice is None:
+            indice = len(log_ref)
+        indice_tabla = primera_divergencia(tabla_ref, tabla_alt)
+        reproductor = minimizar(
+            lineas, lambda candidato: _divergen(fabrica_referencia, fabrica_alternativa, candidato))
+        divergencia = Divergencia(
+            lineas, indice,
+            log_ref[indice] if indice < len(log_ref) else None,
+            log_alt[indice] if indice < len(log_alt) else None,
+            reproductor,
+            indice_tabla,
+            tabla_ref[indice_tabla] if indice_tabla is not None and indice_tabla < len(tabla_ref) else None,
+            tabla_alt[indice_tabla] if indice_tabla is not None and indice_tabla < len(tabla_alt) else None)
+        return ResultadoDiferencial(numero, bytes_totales, tiempo_referencia, tiempo_alternativo, divergencia)
+
+    return ResultadoDiferencial(len(conjunto), bytes_totales, tiempo_referencia, tiempo_alternativo, None)
+
+
+def cargar_fabrica(especificacion):
+    """
+    Obtiene una fábrica a partir de una especificación 'modulo:atributo'.
+
+    Args:
+        especificacion (str): Módulo y atributo separados por dos puntos
+
+    Returns:
+        callable: Fábrica del motor
+    """
+    modulo, _, atributo = especificacion.partition(':')
+    return getattr(importlib.import_module(modulo), atributo or 'Lexico')
+
+
+def main():
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Compara un motor léxico contra Lexico.")
+    parser.add_argument('motor', help="Fábrica del motor alternativo, como modulo:atributo")
+    parser.add_argument('--casos', type=int, default=2000)
+    parser.add_argument('--semilla', type=int, default=0)
+    args = parser.parse_args()
+
+    resultado = comparar_motores(cargar_fabrica(args.motor), casos=args.casos, semilla=args.semilla)
+    print(resultado.resumen())
+    raise SystemExit(1 if resultado.divergencia else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Núcleo de extracción de lexemas con implementación nativa opcional.
+
+escanear(linea, inicio, tabla) devuelve la lista de tuplas (tipo, inicio, fin)
+de los lexemas de la línea a partir de inicio; recorrer(linea, inicio, tabla)
+las produce de a una, consultando la tabla en cada paso. Si el módulo
+compilado analizador._escaner está disponible se usa automáticamente; si no,
+escanear y recorrer son None y Lexico sigue usando su recorrido en Python.
+
+Compilación del módulo nativo:
+    python setup.py build_ext --inplace
+
+Uso:
+    python -m analizador.escaner [--tamano N]
+"""
+
+import argparse
+
+try:
+    from analizador._escaner import escanear, recorrer
+except ImportError:
+    escanear = recorrer = None
+
+NATIVO = escanear is not None
+
+# Tipos de lexema devueltos por escanear. Las palabras y cadenas ya vienen
+# clasificadas con las reglas de Automatas; PALABRA es una palabra que no es
+# identificador ni número y se clasifica en Python.
+DOS_CARACTERES = 0
+OPERADOR = 1
+CADENA = 2
+PALABRA = 3
+IDENTIFICADOR = 4
+NUMERO = 5
+CADENA_ABIERTA = 6
+
+OPERADORES = frozenset('+-*/=.,:(){}&|<>;')
+DELIMITADORES = OPERADORES | {'"'}
+
+
+def _clasificar_palabra(palabra):
+    """
+    Clasifica una palabra con las reglas de Automatas.isIdentificador e isNumero.
+
+    Args:
+        palabra (str): Palabra sin espacios ni delimitadores
+
+    Returns:
+        int: IDENTIFICADOR, NUMERO o PALABRA
+    """
+    primero = palabra[0]
+    if (primero.isalpha() or primero == '_') and all(c.isalnum() or c == '_' for c in palabra[1:]):
+        return IDENTIFICADOR
+    if palabra.isdigit():
+        return NUMERO
+    return PALABRA
+
+
+def escanear_python(linea, inicio, tabla):
+    """
+    Implementación en Python de escanear(), usada como referencia de
+    conformidad del módulo nativo.
+
+    Args:
+        linea (str): Línea de código
+        inicio (int): Posición desde la que se recorre la línea
+        tabla: Contenedor de lexemas de la tabla de símbolos (admite 'in')
+
+    Returns:
+        list: Tuplas (tipo, inicio, fin)
+    """
+    return list(recorrer_python(linea, inicio, tabla))
+
+
+def recorrer_python(linea, inicio, tabla):
+    """
+    Implementación en Python de recorrer(). La tabla se consulta al cortar
+    cada lexema, así que los lexemas agregados durante el recorrido se respetan.
+
+    Args:
+        linea (str): Línea de código
+        inicio (int): Posición desde la que se recorre la línea
+        tabla: Contenedor de lexemas de la tabla de símbolos (admite 'in')
+
+    Yields:
+        tuple: (tipo, inicio, fin)
+    """
+    n = len(linea)
+    i = max(inicio, 0)
+    while i < n:
+        c = linea[i]
+        if c.isspace():
+            i += 1
+            continue
+
+        if i < n - 1 and linea[i:i + 2] in tabla:
+            yield DOS_CARACTERES, i, i + 2
+            i += 2
+            continue
+
+        if c in OPERADORES:
+            tipo, fin = OPERADOR, i + 1
+        elif c == '"':
+            fin = linea.find('"', i + 1)
+            if fin >= 0:
+                tipo, fin = CADENA, fin + 1
+            else:
+                tipo, fin = (CADENA if i == n - 1 else CADENA_ABIERTA), n
+        else:
+            fin = i
+            while fin < n and not linea[fin].isspace() and linea[fin] not in DELIMITADORES:
+                fin += 1
+            tipo = _clasificar_palabra(linea[i:fin])
+        yield tipo, i, fin
+        i = fin
+
+
+def main():
+    """Mide el rendimiento de los motores disponibles sobre líneas típicas y largas."""
+    import functools
+    from analizador.lexico import Lexico
+    from analizador.rendimiento import expandir, medir
+
+    parser = argparse.ArgumentParser(description="Mide el escáner nativo frente al recorrido en Python.")
+    parser.add_argument('--tamano', type=int, default=100000)
+    args = parser.parse_args()
+
+    motores = {
+        'python': functools.partial(Lexico, acelerado=False),
+        'prepaso': functools.partial(Lexico, acelerado=False, prepaso=True),
+    }
+    if NATIVO:
+        motores['nativo'] = functools.partial(Lexico, acelerado=True)
+    else:
+        print("Módulo nativo no disponible (python setup.py build_ext --inplace)")
+
+    casos = {
+        'código típico': 'c = a + b; imprimir("total ", c); ',
+        'identificador largo': 'variable_larga_sin_espacios',
+        'operadores': '&|',
+        'no ASCII': 'año = año + ñandú; ',
+    }
+    print(f"{'caso':<22}" + ''.join(f"{nombre + ' MB/s':>16}" for nombre in motores))
+    for nombre, patron in casos.items():
+        lineas = [''.join(expandir(patron, args.tamano))]
+        fila = f"{nombre:<22}"
+        for fabrica in motores.values():
+            fila += f"{1000 / medir(fabrica, lineas):>16.2f}"
+        print(fila)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+"""
+Estadísticas acumuladas durante el análisis léxico.
+
+Uso:
+    python -m analizador.estadisticas archivo1.txt archivo2.txt ... [--procesos N] [--esbozo K]
+"""
+
+import argparse
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+
+TIPOS_ERROR = ('No reconocido', 'Identificador no registrado')
+
+
+class EsbozoFrecuentes:
+    """
+    Esbozo de elementos frecuentes (Misra-Gries con pesos) que mantiene
+    a lo sumo 2 * capacidad contadores. Cada cuenta subestima la real en
+    como máximo total / (capacidad + 1), y los esbozos se pueden fusionar.
+    """
+
+    def __init__(self, capacidad):
+        """
+        Inicializa el esbozo.
+
+        Args:
+            capacidad (int): Cantidad de elementos frecuentes a conservar
+        """
+        self.capacidad = capacidad
+        self.cuentas = {}
+        self.total = 0
+
+    def agregar(self, clave, cantidad=1):
+        """
+        Suma apariciones de un elemento.
+
+        Args:
+            clave: Elemento observado
+            cantidad (int): Apariciones a sumar
+        """
+        self.total += cantidad
+        self.cuentas[clave] = self.cuentas.get(clave, 0) + cantidad
+        if len(self.cuentas) > 2 * self.capacidad:
+            self._podar()
+
+    def _podar(self):
+        """Resta a todos los contadores la cuenta del elemento capacidad+1."""
+        if len(self.cuentas) <= self.capacidad:
+            return
+        umbral = sorted(self.cuentas.values(), reverse=True)[self.capacidad]
+        self.cuentas = {c: n - umbral for c, n in self.cuentas.items() if n > umbral}
+
+    def fusionar(self, otro):
+        """
+        Incorpora las cuentas de otro esbozo.
+
+        Args:
+            otro (EsbozoFrecuentes): Esbozo a fusionar
+        """
+        for clave, cantidad in otro.cuentas.items():
+            self.cuentas[clave] = self.cuentas.get(clave, 0) + cantidad
+        self.total += otro.total
+        self._podar()
+
+    def most_common(self, n=None):
+        """
+        Devuelve los elementos más frecuentes, como Counter.most_common().
+
+        Args:
+            n (int, optional): Cantidad de elementos
+
+        Returns:
+            list: Tuplas (elemento, cuenta estimada)
+        """
+        return Counter(self.cuentas).most_common(n)
+
+
+class EstadisticasLexicas:
+    """
+    Contadores que Lexico actualiza mientras analiza. Durante el análisis
+    los símbolos de la tabla se cuentan por su posición; consolidar()
+    traduce esas cuentas a lexemas para poder fusionar estadísticas de
+    distintos archivos o procesos sin conservar el flujo de tokens.
+    """
+
+    def __init__(self, capacidad_esbozo=None):
+        """
+        Inicializa las estadísticas.
+
+        Args:
+            capacidad_esbozo (int, optional): Si se indica, los identificadores
+                se cuentan con un EsbozoFrecuentes de esa capacidad
+        """
+        self.por_tipo = Counter()
+        self.por_simbolo = Counter()
+        self.reservadas = Counter()
+        self.identificadores = EsbozoFrecuentes(capacidad_esbozo) if capacidad_esbozo else Counter()
+        self.tokens = 0
+        self.errores = 0
+        self.lineas = 0
+        self.bytes = 0
+        self.segundos = 0.0
+        self.archivos = {}
+        self._al_abrir_archivo = self._totales()
+
+    def _totales(self):
+        """
+        Obtiene los totales que se resumen por archivo.
+
+        Returns:
+            dict: tokens, errores, lineas y bytes acumulados
+        """
+        return {'tokens': self.tokens, 'errores': self.errores, 'lineas': self.lineas, 'bytes': self.bytes}
+
+    def registrar_token(self, tipo, posicion):
+        """
+        Cuenta un token.
+
+        Args:
+            tipo (str): Tipo del token
+            posicion (int or None): Posición del símbolo en la tabla, si está en ella
+        """
+        self.tokens += 1
+        self.por_tipo[tipo] += 1
+        if posicion is not None:
+            self.por_simbolo[posicion] += 1
+        elif tipo in TIPOS_ERROR:
+            self.errores += 1
+
+    def registrar_linea(self, linea, segundos):
+        """
+        Cuenta una línea analizada.
+
+        Args:
+            linea (str): Línea analizada
+            segundos (float): Tiempo empleado en analizarla
+        """
+        self.lineas += 1
+        self.bytes += len(linea)
+        self.segundos += segundos
+
+    def consolidar(self, tabla_simbolos):
+        """
+        Traduce las cuentas por posición a cuentas por lexema.
+
+        Args:
+            tabla_simbolos (list): Tabla de símbolos del analizador que generó las cuentas
+        """
+        for posicion, cantidad in self.por_simbolo.items():
+            simbolo = tabla_simbolos[posicion]
+            if simbolo.palabraReservada:
+                self.reservadas[simbolo.lexema] += cantidad
+            elif isinstance(self.identificadores, EsbozoFrecuentes):
+                self.identificadores.agregar(simbolo.lexema, cantidad)
+            else:
+                self.identificadores[simbolo.lexema] += cantidad
+        self.por_simbolo = Counter()
+
+    def cerrar_archivo(self, ruta, tabla_simbolos):
+        """
+        Consolida las cuentas y guarda el resumen de un archivo: lo contado
+        desde el cierre anterior, de modo que un mismo objeto puede
+        compartirse entre varios archivos analizados uno tras otro.
+
+        Args:
+            ruta (str): Ruta del archivo analizado
+            tabla_simbolos (list): Tabla de símbolos usada en el análisis
+        """
+        self.consolidar(tabla_simbolos)
+        totales = self._totales()
+        self.archivos[ruta] = {clave: totales[clave] - self._al_abrir_archivo[clave] for clave in totales}
+        self._al_abrir_archivo = totales
+
+    def fusionar(self, otra):
+        """
+        Incorpora las estadísticas consolidadas de otro análisis.
+
+        Args:
+            otra (EstadisticasLexicas): Estadísticas a fusionar
+        """
+        self.por_tipo.update(otra.por_tipo)
+        self.reservadas.update(otra.reservadas)
+        if isinstance(self.identificadores, EsbozoFrecuentes):
+            if isinstance(otra.identificadores, EsbozoFrecuentes):
+                self.identificadores.fusionar(otra.identificadores)
+            else:
+                for lexema, cantidad in otra.identificadores.items():
+                    self.identificadores.agregar(lexema, cantidad)
+        else:
+            self.identificadores.update(dict(otra.identificadores.most_common()))
+        self.tokens += otra.tokens
+        self.errores += otra.errores
+        self.lineas += otra.lineas
+        self.bytes += otra.bytes
+        self.segundos += otra.segundos
+        self.archivos.update(otra.archivos)
+        # Lo fusionado ya tiene su propio resumen y no se atribuye al archivo en curso
+        for clave, valor in otra._totales().items():
+            self._al_abrir_archivo[clave] += valor
+
+    def lineas_por_segundo(self):
+        """
+        Calcula la velocidad de análisis.
+
+        Returns:
+            float: Líneas analizadas por segundo
+        """
+        return self.lineas / self.segundos if self.segundos else 0.0
+
+    def reporte(self, n=10):
+        """
+        Genera un reporte de texto con las estadísticas.
+
+        Args:
+            n (int): Cantidad de identificadores y archivos a listar
+
+        Returns:
+            str: Reporte
+        """
+        lineas = [
+            f"Archivos: {len(self.archivos)}, líneas: {self.lineas}, bytes: {self.bytes}, "
+            f"tokens: {self.tokens}, errores: {self.errores}",
+            f"Velocidad: {self.lineas_por_segundo():.0f} líneas/s",
+            "",
+            "Tokens por tipo:",
+        ]
+        for tipo, cantidad in self.por_tipo.most_common():
+            lineas.append(f"  {tipo:<30} {cantidad}")
+
+        lineas.extend(["", "Identificadores más usados:"])
+        for lexema, cantidad in self.identificadores.most_common(n):
+            lineas.append(f"  {lexema:<30} {cantidad}")
+
+        if self.archivos:
+            lineas.extend(["", "Errores por cada 1000 tokens:"])
+            densidades = sorted(
+                ((1000 * a['errores'] / a['tokens'] if a['tokens'] else 0.0, ruta)
+                 for ruta, a in self.archivos.items()),
+                reverse=True)
+            for densidad, ruta in densidades[:n]:
+                lineas.append(f"  {ruta:<30} {densidad:.1f}")
+
+        return '\n'.join(lineas)
+
+
+def analizar_archivo(ruta, capacidad_esbozo=None):
+    """
+    Analiza un archivo recolectando estadísticas sin conservar los tokens.
+
+    Args:
+        ruta (str): Ruta del archivo
+        capacidad_esbozo (int, optional): Capacidad del esbozo de identificadores
+
+    Returns:
+        EstadisticasLexicas: Estadísticas consolidadas del archivo
+    """
+    from analizador.lexico import Lexico
+
+    estadisticas = EstadisticasLexicas(capacidad_esbozo)
+    lexico = Lexico(estadisticas=estadisticas)
+    with open(ruta, 'r', encoding='utf-8') as f:
+        for linea in f:
+            linea = linea.rstrip('\n')
+            if linea.strip():
+                lexico.analizarLinea(linea)
+                lexico.limpiar_log()
+    estadisticas.cerrar_archivo(ruta, lexico.obtener_tabla_simbolos())
+    return estadisticas
+
+
+def analizar_lote(rutas, procesos=None, capacidad_esbozo=None):
+    """
+    Analiza varios archivos, en paralelo si se indica, y fusiona sus estadísticas.
+
+    Args:
+        rutas (list): Rutas de los archivos
+        procesos (int, optional): Procesos de trabajo; 0 o 1 analiza en este proceso
+        capacidad_esbozo (int, optional): Capacidad del esbozo de identificadores
+
+    Returns:
+        EstadisticasLexicas: Estadísticas de todos los archivos
+    """
+    total = EstadisticasLexicas(capacidad_esbozo)
+    if procesos is not None and procesos <= 1:
+        for ruta in rutas:
+            total.fusionar(analizar_archivo(ruta, capacidad_esbozo))
+        return total
+
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        for estadisticas in ejecutor.map(analizar_archivo, rutas, [capacidad_esbozo] * len(rutas)):
+            total.fusionar(estadisticas)
+    return total
+
+
+def main():
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Estadísticas léxicas de varios archivos.")
+    parser.add_argument('rutas', nargs='+')
+    parser.add_argument('--procesos', type=int, default=None)
+    parser.add_argument('--esbozo', type=int, default=None,
+                        help="Capacidad del esbozo de identificadores frecuentes")
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    estadisticas = analizar_lote([os.path.abspath(r) for r in args.rutas], args.procesos, args.esbozo)
+    print(estadisticas.reporte(args.top))
+    print(f"\nTiempo total: {time.perf_counter() - inicio:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""
+Índice invertido de identificadores entre archivos.
+
+Guarda, para cada lexema de identificador, sus apariciones como
+(archivo, línea, columna) en una base SQLite con tablas sin rowid, y
+registra qué identificadores introdujo cada archivo. Las actualizaciones
+son por archivo: al volver a indexar un archivo se reemplazan solo sus
+apariciones y se conservan los identificadores que introdujo y todavía contiene.
+
+Uso:
+    python -m analizador.indice indice.db indexar archivo1.txt archivo2.txt ...
+    python -m analizador.indice indice.db buscar lexema
+    python -m analizador.indice indice.db nuevos
+"""
+
+import argparse
+import sqlite3
+import time
+
+from analizador.lexico import Lexico, TablaPrecargada
+
+
+ESQUEMA = '''
+CREATE TABLE IF NOT EXISTS archivos (
+    id INTEGER PRIMARY KEY,
+    ruta TEXT UNIQUE NOT NULL
+);
+CREATE TABLE IF NOT EXISTS lexemas (
+    id INTEGER PRIMARY KEY,
+    lexema TEXT UNIQUE NOT NULL
+);
+CREATE TABLE IF NOT EXISTS ocurrencias (
+    lexema INTEGER NOT NULL,
+    archivo INTEGER NOT NULL,
+    linea INTEGER NOT NULL,
+    columna INTEGER NOT NULL,
+    PRIMARY KEY (lexema, archivo, linea, columna)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ocurrencias_archivo ON ocurrencias (archivo);
+CREATE TABLE IF NOT EXISTS nuevos (
+    archivo INTEGER NOT NULL,
+    lexema INTEGER NOT NULL,
+    PRIMARY KEY (archivo, lexema)
+) WITHOUT ROWID;
+'''
+
+
+class IndiceIdentificadores:
+    """
+    Índice persistente lexema -> apariciones. Lexico lo alimenta mediante
+    agregar() y marcar_nuevo(); las apariciones de un archivo se acumulan
+    en memoria y se escriben en una sola transacción en terminar_archivo().
+    """
+
+    def __init__(self, ruta=':memory:'):
+        """
+        Abre (o crea) el índice.
+
+        Args:
+            ruta (str): Ruta de la base de datos SQLite
+        """
+        self.ruta = ruta
+        self._conexion = sqlite3.connect(ruta)
+        self._conexion.executescript(ESQUEMA)
+        self._ids_lexemas = {}
+        self._archivo = None
+        self._ocurrencias = []
+        self._nuevos = []
+
+    def iniciar_archivo(self, ruta_archivo):
+        """
+        Comienza a indexar un archivo. Sus apariciones anteriores se
+        reemplazan al llamar a terminar_archivo().
+
+        Args:
+            ruta_archivo (str): Ruta del archivo a indexar
+        """
+        self._archivo = ruta_archivo
+        self._ocurrencias = []
+        self._nuevos = []
+
+    def agregar(self, lexema, linea, columna):
+        """
+        Registra una aparición de un identificador en el archivo actual.
+
+        Args:
+            lexema (str): Lexema del identificador
+            linea (int): Número de línea (desde 1)
+            columna (int): Columna (desde 1)
+        """
+        self._ocurrencias.append((lexema, linea, columna))
+
+    def marcar_nuevo(self, lexema):
+        """
+        Registra que el archivo actual introdujo un identificador.
+
+        Args:
+            lexema (str): Lexema del identificador
+        """
+        self._nuevos.append(lexema)
+
+    def terminar_archivo(self):
+        """
+        Escribe en la base las apariciones del archivo actual. Al volver a
+        indexar un archivo con la tabla que ya contiene sus identificadores
+        estos no se marcan como nuevos, así que se conservan los que el
+        archivo introdujo antes y todavía contiene. Si se indexa sin esa
+        tabla, los identificadores que ya introdujo otro archivo no se
+        registran como nuevos.
+        """
+        with self._conexion:
+            id_archivo = self._id_archivo(self._archivo)
+            self._conexion.execute("DELETE FROM ocurrencias WHERE archivo = ?", (id_archivo,))
+            self._conexion.executemany(
+                "INSERT OR IGNORE INTO ocurrencias VALUES (?, ?, ?, ?)",
+                ((self._id_lexema(lexema), id_archivo, linea, columna)
+                 for lexema, linea, columna in self._ocurrencias))
+            self._conexion.execute(
+                "DELETE FROM nuevos WHERE archivo = ? AND lexema NOT IN "
+                "(SELECT lexema FROM ocurrencias WHERE archivo = ?)", (id_archivo, id_archivo))
+            self._conexion.executemany(
+                "INSERT OR IGNORE INTO nuevos SELECT ?, ? WHERE NOT EXISTS "
+                "(SELECT 1 FROM nuevos WHERE lexema = ? AND archivo != ?)",
+                ((id_archivo, id_lexema, id_lexema, id_archivo)
+                 for id_lexema in map(self._id_lexema, self._nuevos)))
+        self._archivo = None
+        self._ocurrencias = []
+        self._nuevos = []
+
+    def eliminar_archivo(self, ruta_archivo):
+        """
+        Quita del índice todas las apariciones de un archivo.
+
+        Args:
+            ruta_archivo (str): Ruta del archivo
+        """
+        with self._conexion:
+            fila = self._conexion.execute(
+                "SELECT id FROM archivos WHERE ruta = ?", (ruta_archivo,)).fetchone()
+            if fila:
+                self._conexion.execute("DELETE FROM ocurrencias WHERE archivo = ?", fila)
+                self._conexion.execute("DELETE FROM nuevos WHERE archivo = ?", fila)
+                self._conexion.execute("DELETE FROM archivos WHERE id = ?", fila)
+
+    def buscar(self, lexema):
+        """
+        Obtiene las apariciones de un identificador.
+
+        Args:
+            lexema (str): Lexema del identificador
+
+        Returns:
+            list: Tuplas (ruta, línea, columna) ordenadas por archivo y posición
+        """
+        return self._conexion.execute(
+            "SELECT a.ruta, o.linea, o.columna FROM lexemas l "
+            "JOIN ocurrencias o ON o.lexema = l.id "
+            "JOIN archivos a ON a.id = o.archivo "
+            "WHERE l.lexema = ? ORDER BY a.ruta, o.linea, o.columna", (lexema,)).fetchall()
+
+    def archivos_con_nuevos(self):
+        """
+        Obtiene los identificadores que introdujo cada archivo.
+
+        Returns:
+            dict: Ruta -> lista de lexemas nuevos
+        """
+        resultado = {}
+        filas = self._conexion.execute(
+            "SELECT a.ruta, l.lexema FROM nuevos n "
+            "JOIN archivos a ON a.id = n.archivo "
+            "JOIN lexemas l ON l.id = n.lexema ORDER BY a.ruta, l.lexema")
+        for ruta, lexema in filas:
+            resultado.setdefault(ruta, []).append(lexema)
+        return resultado
+
+    def cerrar(self):
+        """Cierra la base de datos."""
+        self._conexion.close()
+
+    def _id_archivo(self, ruta_archivo):
+        """
+        Obtiene (creándolo si hace falta) el id de un archivo.
+
+        Args:
+            ruta_archivo (str): Ruta del archivo
+
+        Returns:
+            int: Id del archivo
+        """
+        self._conexion.execute("INSERT OR IGNORE INTO archivos (ruta) VALUES (?)", (ruta_archivo,))
+        return self._conexion.execute(
+            "SELECT id FROM archivos WHERE ruta = ?", (ruta_archivo,)).fetchone()[0]
+
+    def _id_lexema(self, lexema):
+        """
+        Obtiene (creándolo si hace falta) el id de un lexema, con caché en memoria.
+
+        Args:
+            lexema (str): Lexema del identificador
+
+        Returns:
+            int: Id del lexema
+        """
+        id_lexema = self._ids_lexemas.get(lexema)
+        if id_lexema is None:
+            self._conexion.execute("INSERT OR IGNORE INTO lexemas (lexema) VALUES (?)", (lexema,))
+            id_lexema = self._conexion.execute(
+                "SELECT id FROM lexemas WHERE lexema = ?", (lexema,)).fetchone()[0]
+            self._ids_lexemas[lexema] = id_lexema
+        return id_lexema
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+def indexar_archivos(indice, rutas, tabla_precargada=None):
+    """
+    Analiza los archivos en orden e indexa sus identificadores. La tabla de
+    símbolos pasa de un archivo al siguiente, de modo que los tokens id_N son
+    estables y cada archivo figura como introductor solo de los
+    identificadores que no aparecieron en archivos anteriores.
+
+    Args:
+        indice (IndiceIdentificadores): Índice a actualizar
+        rutas (list): Rutas de los archivos
+        tabla_precargada (TablaPrecargada, optional): Tabla inicial
+
+    Returns:
+        TablaPrecargada: Tabla con los identificadores de todos los archivos
+    """
+    for ruta in rutas:
+        lexico = Lexico(tabla_precargada=tabla_precargada, indice=indice)
+        indice.iniciar_archivo(ruta)
+        with open(ruta, 'r', encoding='utf-8') as f:
+            for numero_linea, linea in enumerate(f, 1):
+                linea = linea.rstrip('\n')
+                if linea.strip():
+                    lexico.analizarLinea(linea, numero_linea)
+                    lexico.limpiar_log()
+        indice.terminar_archivo()
+        tabla_precargada = TablaPrecargada(lexico.obtener_tabla_simbolos())
+    return tabla_precargada
+
+
+def main():
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Índice de identificadores entre archivos.")
+    parser.add_argument('base', help="Ruta de la base de datos del índice")
+    subparsers = parser.add_subparsers(dest='comando', required=True)
+    indexar = subparsers.add_parser('indexar')
+    indexar.add_argument('rutas', nargs='+')
+    buscar = subparsers.add_parser('buscar')
+    buscar.add_argument('lexema')
+    subparsers.add_parser('nuevos')
+    args = parser.parse_args()
+
+    with IndiceIdentificadores(args.base) as indice:
+        inicio = time.perf_counter()
+        if args.comando == 'indexar':
+            indexar_archivos(indice, args.rutas)
+            print(f"Indexados {len(args.rutas)} archivos")
+        elif args.comando == 'buscar':
+            for ruta, linea, columna in indice.buscar(args.lexema):
+                print(f"{ruta}:{linea}:{columna}")
+        else:
+            for ruta, lexemas in indice.archivos_con_nuevos().items():
+                print(f"{ruta}: {', '.join(lexemas)}")
+        print(f"({(time.perf_counter() - inicio) * 1000:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
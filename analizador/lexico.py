@@ -1,5 +1,83 @@
+import time
+from collections import OrderedDict
+
 from compilador.simbolos import Simbolo
+from compilador.instantanea import cargar_identificadores, guardar_identificadores
 from analizador.automatas import Automatas
+from analizador import escaner
+from analizador.prepaso import segmentar
+from analizador.registro import RegistroSalida
+from analizador.salidas import formatear_entrada
+
+
+MODO_ANEXAR = 'anexar'
+MODO_CONGELADO = 'congelado'
+
+# Categorías de los lexemas que no están en la tabla de símbolos
+CATEGORIA_IDENTIFICADOR = 'identificador'
+CATEGORIA_NUMERO = 'numero'
+CATEGORIA_REAL = 'real'
+CATEGORIA_CADENA = 'cadena'
+CATEGORIA_ERROR = 'error'
+
+# Categoría de los tipos que el escáner nativo ya clasifica
+CATEGORIAS_NATIVAS = {
+    escaner.IDENTIFICADOR: CATEGORIA_IDENTIFICADOR,
+    escaner.NUMERO: CATEGORIA_NUMERO,
+    escaner.CADENA: CATEGORIA_CADENA,
+    escaner.CADENA_ABIERTA: CATEGORIA_ERROR,
+}
+
+
+def _indexar(simbolos):
+    """
+    Construye un índice lexema -> posición en la tabla de símbolos.
+    Si un lexema aparece varias veces se conserva la primera posición.
+    
+    Args:
+        simbolos (list): Tabla de símbolos
+        
+    Returns:
+        dict: Índice de la tabla
+    """
+    indice = {}
+    for posicion, simbolo in enumerate(simbolos):
+        indice.setdefault(simbolo.lexema, posicion)
+    return indice
+
+
+class TablaPrecargada:
+    """
+    Tabla de símbolos con identificadores precargados (por ejemplo desde una
+    instantánea) que pueden compartir varios analizadores. Cada Lexico copia
+    la lista y el índice, por lo que la tabla compartida nunca se modifica.
+    """
+    
+    def __init__(self, simbolos):
+        """
+        Inicializa la tabla precargada.
+        
+        Args:
+            simbolos (list): Tabla de símbolos completa, incluidas las palabras reservadas
+        """
+        self.simbolos = simbolos
+        self.indice = _indexar(simbolos)
+        self.num_identificadores = sum(1 for s in simbolos if not s.palabraReservada)
+    
+    @classmethod
+    def desde_archivo(cls, ruta):
+        """
+        Carga una instantánea guardada con Lexico.guardar_tabla().
+        
+        Args:
+            ruta (str): Ruta del archivo de instantánea
+            
+        Returns:
+            TablaPrecargada: Tabla con palabras reservadas e identificadores
+        """
+        simbolos = Lexico().obtener_tabla_simbolos()
+        simbolos.extend(cargar_identificadores(ruta))
+        return cls(simbolos)
 
 
 class Lexico:
@@ -8,11 +86,71 @@ class Lexico:
     reconoce tokens usando la tabla de símbolos y autómatas.
     """
     
-    def __init__(self):
-        """Inicializa el analizador léxico con la tabla de símbolos inicial."""
-        self.tabla_simbolos = self._inicializar_tabla_simbolos()
+    def __init__(self, salidas=None, tabla_precargada=None, modo=MODO_ANEXAR, estadisticas=None,
+                 prepaso=False, indice=None, presupuesto_memoria=None, cache_lineas=None,
+                 acelerado=None):
+        """
+        Inicializa el analizador léxico con la tabla de símbolos inicial.
+        
+        Args:
+            salidas (list, optional): Salidas (ver analizador.salidas) que
+                reciben cada token en cuanto se reconoce
+            tabla_precargada (TablaPrecargada, optional): Tabla inicial con
+                identificadores ya conocidos
+            modo (str): MODO_ANEXAR agrega los identificadores nuevos a la tabla;
+                MODO_CONGELADO no modifica la tabla y los informa como error
+            estadisticas (EstadisticasLexicas, optional): Contadores que se
+                actualizan durante el análisis
+            prepaso (bool): Si es True, cada línea se clasifica completa antes
+                de extraer lexemas (ver analizador.prepaso)
+            indice (IndiceIdentificadores, optional): Índice que recibe la
+                posición de cada identificador (ver analizador.indice)
+            presupuesto_memoria (int, optional): Bytes máximos aproximados del log
+                en memoria; al superarlos el log se vuelca a disco
+            cache_lineas (int, optional): Si se indica, guarda los lexemas ya
+                clasificados de hasta esa cantidad de líneas distintas (LRU) y
+                reutiliza el resultado cuando una línea se repite
+            acelerado (bool, optional): True exige el escáner nativo, False usa
+                el recorrido en Python; por defecto se usa el nativo si está
+                compilado y no se pidió el pre-paso (ver analizador.escaner)
+        """
+        if modo not in (MODO_ANEXAR, MODO_CONGELADO):
+            raise ValueError(f"Modo no soportado: {modo}")
+        if acelerado and not escaner.NATIVO:
+            raise RuntimeError("El escáner nativo no está compilado (python setup.py build_ext --inplace)")
+        
+        if tabla_precargada:
+            self.tabla_simbolos = list(tabla_precargada.simbolos)
+            self._indice_simbolos = dict(tabla_precargada.indice)
+            self._num_identificadores = tabla_precargada.num_identificadores
+        else:
+            self.tabla_simbolos = self._inicializar_tabla_simbolos()
+            self._indice_simbolos = _indexar(self.tabla_simbolos)
+            self._num_identificadores = 0
+        self.modo = modo
+        self.identificadores_nuevos = []
+        self._no_registrados = set()
         self.automatas = Automatas()
-        self.log_salida = []
+        self.presupuesto_memoria = presupuesto_memoria
+        self.log_salida = self._nuevo_log()
+        self.salidas = list(salidas) if salidas else []
+        self.estadisticas = estadisticas
+        self.prepaso = prepaso
+        if acelerado is None:
+            acelerado = escaner.NATIVO and not prepaso
+        self._recorrer = escaner.recorrer if acelerado else None
+        self.indice = indice
+        self.linea_actual = 0
+        self.columna_actual = 0
+        self.cache_lineas = cache_lineas
+        self._cache = OrderedDict() if cache_lineas else None
+        self._version_dos_caracteres = 0
+        self._aciertos_cache = 0
+        self._fallos_cache = 0
+        self._segundos_aciertos = 0.0
+        self._segundos_fallos = 0.0
+        self._bytes_aciertos = 0
+        self._bytes_fallos = 0
     
     def _inicializar_tabla_simbolos(self):
         """
@@ -63,18 +201,37 @@ class Lexico:
         """
         return self.tabla_simbolos
     
-    def analizarLinea(self, linea):
+    def guardar_tabla(self, ruta):
+        """
+        Guarda los identificadores de la tabla de símbolos en una instantánea
+        que puede cargarse con TablaPrecargada.desde_archivo().
+        
+        Args:
+            ruta (str): Ruta del archivo de instantánea
+        """
+        guardar_identificadores(self.tabla_simbolos, ruta)
+    
+    def analizarLinea(self, linea, numero_linea=None):
         """
         Analiza una línea de código carácter por carácter,
         identificando lexemas y tokens.
         
         Args:
             linea (str): Línea de código a analizar
+            numero_linea (int, optional): Número de la línea en el archivo; por
+                defecto se cuentan las llamadas a analizarLinea
         """
+        self.linea_actual = self.linea_actual + 1 if numero_linea is None else numero_linea
         if not linea or len(linea.strip()) == 0:
             return
         
+        if self.estadisticas is None:
+            self._procesar_caracteres(linea)
+            return
+        
+        inicio = time.perf_counter()
         self._procesar_caracteres(linea)
+        self.estadisticas.registrar_linea(linea, time.perf_counter() - inicio)
     
     def _procesar_caracteres(self, linea):
         """
@@ -83,6 +240,42 @@ class Lexico:
         Args:
             linea (str): Línea de código a procesar
         """
+        if self._cache is not None:
+            self._procesar_con_cache(linea)
+            return
+        
+        if self._recorrer is not None:
+            for tipo, inicio, fin in self._recorrer(linea, 0, self._indice_simbolos):
+                self.columna_actual = inicio + 1
+                self.analizarLexema(linea[inicio:fin], CATEGORIAS_NATIVAS.get(tipo))
+            return
+        
+        for inicio, lexema in self._lexemas(linea):
+            self.columna_actual = inicio + 1
+            self.analizarLexema(lexema)
+    
+    def _lexemas(self, linea):
+        """
+        Recorre los lexemas de una línea. Es un generador perezoso: cada
+        lexema se extrae después de analizar el anterior, porque los
+        identificadores de dos caracteres agregados a la tabla cambian la
+        forma en que se corta el resto de la línea.
+        
+        Args:
+            linea (str): Línea de código
+            
+        Yields:
+            tuple: (posición inicial, lexema)
+        """
+        if self._recorrer is not None:
+            yield from self._lexemas_nativos(linea)
+            return
+        
+        if self.prepaso:
+            for inicio, fin in segmentar(linea, self._indice_simbolos):
+                yield inicio, linea[inicio:fin]
+            return
+        
         i = 0
         while i < len(linea):
             if linea[i].isspace():
@@ -91,9 +284,84 @@ class Lexico:
             
             lexema, avance = self._obtener_siguiente_lexema(linea, i)
             if lexema:
-                self.analizarLexema(lexema)
+                yield i, lexema
             i += avance
     
+    def _lexemas_nativos(self, linea):
+        """
+        Recorre los lexemas de una línea con el escáner nativo. El cursor
+        corta un lexema por paso y consulta la tabla en ese momento, así que
+        un identificador de dos caracteres agregado durante el análisis
+        cambia el corte del resto de la línea sin volver a escanearla.
+        
+        Args:
+            linea (str): Línea de código
+            
+        Yields:
+            tuple: (posición inicial, lexema)
+        """
+        for _, inicio, fin in self._recorrer(linea, 0, self._indice_simbolos):
+            yield inicio, linea[inicio:fin]
+    
+    def _procesar_con_cache(self, linea):
+        """
+        Procesa una línea usando la caché de líneas repetidas. En un acierto
+        solo se repiten las búsquedas en la tabla y sus efectos (asignación
+        de id_N); la extracción y clasificación de lexemas se reutiliza.
+        Una entrada deja de ser válida si se agregó a la tabla un
+        identificador de dos caracteres, porque cambia el corte de lexemas.
+        
+        Args:
+            linea (str): Línea de código a procesar
+        """
+        inicio = time.perf_counter()
+        entrada = self._cache.get(linea)
+        if entrada is not None and entrada[0] == self._version_dos_caracteres:
+            self._cache.move_to_end(linea)
+            for columna, lexema, categoria in entrada[1]:
+                self.columna_actual = columna
+                if categoria is None:
+                    self.analizarLexema(lexema)
+                else:
+                    self._procesar_categoria(lexema, categoria)
+            self._aciertos_cache += 1
+            self._bytes_aciertos += len(linea)
+            self._segundos_aciertos += time.perf_counter() - inicio
+            return
+        
+        version = self._version_dos_caracteres
+        lexemas = []
+        for posicion, lexema in self._lexemas(linea):
+            self.columna_actual = posicion + 1
+            lexemas.append((posicion + 1, lexema, self.analizarLexema(lexema)))
+        
+        if self._version_dos_caracteres == version:
+            self._cache[linea] = (version, tuple(lexemas))
+            self._cache.move_to_end(linea)
+            if len(self._cache) > self.cache_lineas:
+                self._cache.popitem(last=False)
+        self._fallos_cache += 1
+        self._bytes_fallos += len(linea)
+        self._segundos_fallos += time.perf_counter() - inicio
+    
+    def estadisticas_cache(self):
+        """
+        Obtiene los contadores de la caché de líneas.
+        
+        Returns:
+            dict: aciertos, fallos, tasa_aciertos, entradas y segundos_ahorrados
+                (estimado con el costo medio por byte de los fallos)
+        """
+        consultas = self._aciertos_cache + self._fallos_cache
+        costo_por_byte = self._segundos_fallos / self._bytes_fallos if self._bytes_fallos else 0.0
+        return {
+            'aciertos': self._aciertos_cache,
+            'fallos': self._fallos_cache,
+            'tasa_aciertos': self._aciertos_cache / consultas if consultas else 0.0,
+            'entradas': len(self._cache) if self._cache is not None else 0,
+            'segundos_ahorrados': costo_por_byte * self._bytes_aciertos - self._segundos_aciertos,
+        }
+    
     def _obtener_siguiente_lexema(self, linea, inicio):
         """
         Obtiene el siguiente lexema de la línea a partir de la posición dada.
@@ -209,21 +477,26 @@ class Lexico:
         Returns:
             Simbolo or None: Símbolo encontrado o None
         """
-        for simbolo in self.tabla_simbolos:
-            if simbolo.lexema == lexema:
-                return simbolo
-        return None
+        posicion = self._indice_simbolos.get(lexema)
+        if posicion is None:
+            return None
+        return self.tabla_simbolos[posicion]
     
-    def analizarLexema(self, lexema):
+    def analizarLexema(self, lexema, categoria=None):
         """
         Analiza un lexema y determina si es una palabra reservada o identificador.
         Actualiza la tabla de símbolos si es un nuevo identificador.
         
         Args:
             lexema (str): Lexema a analizar
+            categoria (str, optional): Categoría ya conocida (la del escáner
+                nativo) para no clasificar con los autómatas si no está en la tabla
+            
+        Returns:
+            str or None: Categoría del lexema si no estaba en la tabla de símbolos
         """
         if not lexema:
-            return
+            return None
         
         simbolo = self._buscar_en_tabla(lexema)
         if simbolo:
@@ -231,8 +504,8 @@ class Lexico:
                 self._procesar_palabra_reservada(simbolo)
             else:
                 self._procesar_identificador_existente(simbolo)
-        else:
-            self._procesar_lexema_no_reservado(lexema)
+            return None
+        return self._procesar_lexema_no_reservado(lexema, categoria)
     
     def _procesar_palabra_reservada(self, simbolo):
         """
@@ -241,7 +514,7 @@ class Lexico:
         Args:
             simbolo (Simbolo): Símbolo a procesar
         """
-        self.log_salida.append(f"Token: {simbolo.token}, Lexema: {simbolo.lexema}, Tipo: Palabra Reservada")
+        self._registrar(simbolo.token, simbolo.lexema, 'Palabra Reservada')
     
     def _procesar_identificador_existente(self, simbolo):
         """
@@ -250,25 +523,62 @@ class Lexico:
         Args:
             simbolo (Simbolo): Símbolo identificador a procesar
         """
-        self.log_salida.append(f"Token: {simbolo.token}, Lexema: {simbolo.lexema}, Tipo: Identificador")
+        self._registrar(simbolo.token, simbolo.lexema, 'Identificador')
     
-    def _procesar_lexema_no_reservado(self, lexema):
+    def _procesar_lexema_no_reservado(self, lexema, categoria=None):
         """
         Procesa un lexema que no está en la tabla de símbolos.
         
         Args:
             lexema (str): Lexema a procesar
+            categoria (str, optional): Categoría ya conocida del lexema
+            
+        Returns:
+            str: Categoría del lexema
+        """
+        if categoria is None:
+            categoria = self._clasificar_lexema(lexema)
+        self._procesar_categoria(lexema, categoria)
+        return categoria
+    
+    def _clasificar_lexema(self, lexema):
+        """
+        Clasifica con los autómatas un lexema que no está en la tabla de símbolos.
+        
+        Args:
+            lexema (str): Lexema a clasificar
+            
+        Returns:
+            str: Una de las constantes CATEGORIA_*
         """
         if self.automatas.isIdentificador(lexema):
+            return CATEGORIA_IDENTIFICADOR
+        if self.automatas.isNumero(lexema):
+            return CATEGORIA_NUMERO
+        if self.automatas.isReal(lexema):
+            return CATEGORIA_REAL
+        if lexema.startswith('"') and lexema.endswith('"'):
+            return CATEGORIA_CADENA
+        return CATEGORIA_ERROR
+    
+    def _procesar_categoria(self, lexema, categoria):
+        """
+        Procesa un lexema ya clasificado.
+        
+        Args:
+            lexema (str): Lexema a procesar
+            categoria (str): Una de las constantes CATEGORIA_*
+        """
+        if categoria == CATEGORIA_IDENTIFICADOR:
             self._procesar_identificador(lexema)
-        elif self.automatas.isNumero(lexema):
+        elif categoria == CATEGORIA_NUMERO:
             self._procesar_numero(lexema)
-        elif self.automatas.isReal(lexema):
+        elif categoria == CATEGORIA_REAL:
             self._procesar_real(lexema)
-        elif lexema.startswith('"') and lexema.endswith('"'):
+        elif categoria == CATEGORIA_CADENA:
             self._procesar_cadena(lexema)
         else:
-            self.log_salida.append(f"Token: ERROR, Lexema: {lexema}, Tipo: No reconocido")
+            self._registrar('ERROR', lexema, 'No reconocido')
     
     def _procesar_identificador(self, lexema):
         """
@@ -279,7 +589,7 @@ class Lexico:
         """
         simbolo_existente = self._buscar_identificador_existente(lexema)
         if simbolo_existente:
-            self.log_salida.append(f"Token: {simbolo_existente.token}, Lexema: {simbolo_existente.lexema}, Tipo: Identificador")
+            self._registrar(simbolo_existente.token, simbolo_existente.lexema, 'Identificador')
         else:
             self._agregar_identificador(lexema)
     
@@ -293,23 +603,38 @@ class Lexico:
         Returns:
             Simbolo or None: Símbolo identificador existente o None
         """
-        for simbolo in self.tabla_simbolos:
-            if simbolo.lexema == lexema and not simbolo.palabraReservada:
-                return simbolo
+        simbolo = self._buscar_en_tabla(lexema)
+        if simbolo and not simbolo.palabraReservada:
+            return simbolo
         return None
     
     def _agregar_identificador(self, lexema):
         """
         Agrega un nuevo identificador a la tabla de símbolos.
+        En modo congelado la tabla no se modifica y el identificador
+        se informa como no registrado.
         
         Args:
             lexema (str): Lexema del identificador a agregar
         """
-        identificadores = [s for s in self.tabla_simbolos if not s.palabraReservada]
-        nuevo_token = f"id_{len(identificadores) + 1}"
+        if self.modo == MODO_CONGELADO:
+            if lexema not in self._no_registrados:
+                self._no_registrados.add(lexema)
+                self.identificadores_nuevos.append(lexema)
+            self._registrar('ERROR', lexema, 'Identificador no registrado')
+            return
+        
+        self.identificadores_nuevos.append(lexema)
+        if self.indice is not None:
+            self.indice.marcar_nuevo(lexema)
+        self._num_identificadores += 1
+        if len(lexema) == 2:
+            self._version_dos_caracteres += 1
+        nuevo_token = f"id_{self._num_identificadores}"
         nuevo_simbolo = Simbolo(nuevo_token, lexema, False)
+        self._indice_simbolos[lexema] = len(self.tabla_simbolos)
         self.tabla_simbolos.append(nuevo_simbolo)
-        self.log_salida.append(f"Token: {nuevo_token}, Lexema: {lexema}, Tipo: Identificador")
+        self._registrar(nuevo_token, lexema, 'Identificador')
     
     def _procesar_numero(self, lexema):
         """
@@ -318,7 +643,7 @@ class Lexico:
         Args:
             lexema (str): Lexema del número
         """
-        self.log_salida.append(f"Token: numero, Lexema: {lexema}, Tipo: Número Entero")
+        self._registrar('numero', lexema, 'Número Entero')
     
     def _procesar_real(self, lexema):
         """
@@ -327,7 +652,7 @@ class Lexico:
         Args:
             lexema (str): Lexema del número real
         """
-        self.log_salida.append(f"Token: real, Lexema: {lexema}, Tipo: Número Real")
+        self._registrar('real', lexema, 'Número Real')
     
     def _procesar_cadena(self, lexema):
         """
@@ -336,18 +661,50 @@ class Lexico:
         Args:
             lexema (str): Lexema de la cadena
         """
-        self.log_salida.append(f"Token: cadena, Lexema: {lexema}, Tipo: Cadena de Texto")
+        self._registrar('cadena', lexema, 'Cadena de Texto')
+    
+    def _registrar(self, token, lexema, tipo):
+        """
+        Registra un token en el log y lo envía a las salidas configuradas.
+        
+        Args:
+            token (str): Token reconocido
+            lexema (str): Lexema asociado
+            tipo (str): Tipo del token
+        """
+        self.log_salida.append(formatear_entrada(token, lexema, tipo))
+        for salida in self.salidas:
+            salida.escribir(token, lexema, tipo)
+        if self.estadisticas is not None:
+            self.estadisticas.registrar_token(tipo, self._indice_simbolos.get(lexema))
+        if self.indice is not None and tipo == 'Identificador':
+            self.indice.agregar(lexema, self.linea_actual, self.columna_actual)
+    
+    def _nuevo_log(self):
+        """
+        Crea un log de salida vacío.
+        
+        Returns:
+            list or RegistroSalida: Lista, o registro con volcado a disco si
+                hay presupuesto de memoria
+        """
+        if self.presupuesto_memoria is None:
+            return []
+        return RegistroSalida(self.presupuesto_memoria)
     
     def obtener_log_salida(self):
         """
         Obtiene el log de salida.
         
         Returns:
-            list: Lista de entradas del log
+            list or RegistroSalida: Secuencia de entradas del log; con presupuesto
+                de memoria, los segmentos en disco se leen bajo demanda
         """
         return self.log_salida
     
     def limpiar_log(self):
         """Limpia el log de salida."""
-        self.log_salida = []
+        if isinstance(self.log_salida, RegistroSalida):
+            self.log_salida.cerrar()
+        self.log_salida = self._nuevo_log()
 
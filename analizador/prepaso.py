@@ -0,0 +1,139 @@
+"""
+Pre-paso de clasificación de caracteres por línea completa.
+
+Cada línea se traduce de una sola vez (bytes.translate para líneas ASCII,
+str.translate para el resto) a una cadena de clases:
+
+    ' '  espacio en blanco (según str.isspace)
+    'o'  operador o delimitador de un carácter
+    'q'  comilla doble
+    'a'  cualquier otro carácter ASCII
+
+Los caracteres no ASCII que no son espacios conservan su valor, que nunca
+coincide con ' ', 'o' ni 'q'. Los límites de cada racha se buscan con
+expresiones regulares sobre la cadena de clases, por lo que el bucle en
+Python da una vuelta por token y no por carácter.
+
+Uso:
+    python -m analizador.prepaso [--tamano N]
+"""
+
+import argparse
+import functools
+import re
+import sys
+import time
+
+OPERADORES = '+-*/=.,:(){}&|<>;'
+
+
+def _clase_ascii(codigo):
+    caracter = chr(codigo)
+    if caracter.isspace():
+        return ' '
+    if caracter in OPERADORES:
+        return 'o'
+    if caracter == '"':
+        return 'q'
+    return 'a'
+
+
+TABLA_BYTES = bytes(ord(_clase_ascii(c)) for c in range(128)) + bytes(128)
+
+
+@functools.lru_cache(maxsize=None)
+def _tabla_unicode():
+    """
+    Construye (una sola vez) la tabla para str.translate.
+
+    Returns:
+        dict: Código de carácter -> clase
+    """
+    tabla = {c: _clase_ascii(c) for c in range(128)}
+    for codigo in range(128, sys.maxunicode + 1):
+        if chr(codigo).isspace():
+            tabla[codigo] = ' '
+    return tabla
+
+
+_FIN_ESPACIOS = (re.compile(rb' *'), re.compile(' *'))
+_FIN_IDENTIFICADOR = (re.compile(rb'[^ oq]*'), re.compile('[^ oq]*'))
+
+
+def clasificar(linea):
+    """
+    Traduce una línea a su cadena de clases de caracteres.
+
+    Args:
+        linea (str): Línea de código
+
+    Returns:
+        bytes or str: Clases (bytes si la línea es ASCII)
+    """
+    if linea.isascii():
+        return linea.encode('ascii').translate(TABLA_BYTES)
+    return linea.translate(_tabla_unicode())
+
+
+def segmentar(linea, tabla):
+    """
+    Divide una línea en lexemas con las mismas reglas que
+    Lexico._obtener_siguiente_lexema.
+
+    Args:
+        linea (str): Línea de código
+        tabla: Contenedor de lexemas de la tabla de símbolos (admite 'in')
+
+    Yields:
+        tuple: (inicio, fin) de cada lexema
+    """
+    clases = clasificar(linea)
+    ascii_ = isinstance(clases, bytes)
+    fin_espacios = _FIN_ESPACIOS[0 if ascii_ else 1].match
+    fin_identificador = _FIN_IDENTIFICADOR[0 if ascii_ else 1].match
+    operador = ord('o') if ascii_ else 'o'
+    comilla = ord('q') if ascii_ else 'q'
+
+    n = len(linea)
+    i = fin_espacios(clases, 0).end()
+    while i < n:
+        if i < n - 1 and linea[i:i + 2] in tabla:
+            fin = i + 2
+        elif clases[i] == operador:
+            fin = i + 1
+        elif clases[i] == comilla:
+            fin = linea.find('"', i + 1)
+            fin = n if fin < 0 else fin + 1
+        else:
+            fin = fin_identificador(clases, i).end()
+        yield i, fin
+        i = fin_espacios(clases, fin).end()
+
+
+def main():
+    """Compara el bucle por carácter con el pre-paso sobre líneas largas."""
+    from analizador.lexico import Lexico
+    from analizador.rendimiento import expandir, medir
+
+    parser = argparse.ArgumentParser(description="Mide el pre-paso de clases de caracteres.")
+    parser.add_argument('--tamano', type=int, default=100000)
+    args = parser.parse_args()
+
+    casos = {
+        'código típico': 'c = a + b; imprimir("total ", c); ',
+        'identificador largo': 'variable_larga_sin_espacios',
+        'cadena larga': '"texto sin cerrar ',
+        'muchos espacios': 'a' + ' ' * 40,
+        'operadores': '&|',
+        'no ASCII': 'año = año + ñandú; ',
+    }
+    print(f"{'caso':<22} {'bucle ns/B':>12} {'prepaso ns/B':>14} {'mejora':>8}")
+    for nombre, patron in casos.items():
+        lineas = [''.join(expandir(patron, args.tamano))]
+        bucle = medir(Lexico, lineas)
+        prepaso = medir(lambda: Lexico(prepaso=True), lineas)
+        print(f"{nombre:<22} {bucle:>12.0f} {prepaso:>14.0f} {bucle / prepaso:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import bisect
+import pickle
+import sys
+import tempfile
+from collections import OrderedDict
+from collections.abc import Sequence
+
+
+class RegistroSalida(Sequence):
+    """
+    Log de salida con presupuesto de memoria. Cuando las entradas en memoria
+    superan el presupuesto se escriben como un segmento en un archivo
+    temporal y solo queda residente una ventana acotada de segmentos, que
+    se vuelven a leer bajo demanda al indexar o recorrer el log.
+    """
+
+    def __init__(self, presupuesto_bytes, segmentos_residentes=2, directorio=None):
+        """
+        Inicializa el registro.
+
+        Args:
+            presupuesto_bytes (int): Memoria máxima aproximada de las entradas pendientes
+            segmentos_residentes (int): Segmentos leídos de disco que se conservan en memoria
+            directorio (str, optional): Directorio del archivo temporal
+        """
+        self.presupuesto_bytes = presupuesto_bytes
+        self.segmentos_residentes = segmentos_residentes
+        self.directorio = directorio
+        self._pendientes = []
+        self._bytes_pendientes = 0
+        self._archivo = None
+        self._segmentos = []
+        self._inicios = []
+        self._total_segmentos = 0
+        self._residentes = OrderedDict()
+
+    def append(self, entrada):
+        """
+        Agrega una entrada al log, volcando a disco si se supera el presupuesto.
+
+        Args:
+            entrada (str): Entrada del log
+        """
+        self._pendientes.append(entrada)
+        self._bytes_pendientes += sys.getsizeof(entrada) + 8
+        if self._bytes_pendientes > self.presupuesto_bytes:
+            self._volcar()
+
+    def _volcar(self):
+        """Escribe las entradas pendientes como un nuevo segmento en disco."""
+        if self._archivo is None:
+            self._archivo = tempfile.TemporaryFile(prefix='log_salida_', dir=self.directorio)
+        datos = pickle.dumps(self._pendientes, protocol=pickle.HIGHEST_PROTOCOL)
+        self._archivo.seek(0, 2)
+        self._segmentos.append((self._archivo.tell(), len(datos)))
+        self._archivo.write(datos)
+        self._inicios.append(self._total_segmentos)
+        self._total_segmentos += len(self._pendientes)
+        self._pendientes = []
+        self._bytes_pendientes = 0
+
+    def _leer_segmento(self, numero):
+        """
+        Obtiene las entradas de un segmento, leyéndolo de disco si no está residente.
+
+        Args:
+            numero (int): Número de segmento
+
+        Returns:
+            list: Entradas del segmento
+        """
+        entradas = self._residentes.get(numero)
+        if entradas is not None:
+            self._residentes.move_to_end(numero)
+            return entradas
+        posicion, longitud = self._segmentos[numero]
+        self._archivo.seek(posicion)
+        entradas = pickle.loads(self._archivo.read(longitud))
+        self._residentes[numero] = entradas
+        while len(self._residentes) > self.segmentos_residentes:
+            self._residentes.popitem(last=False)
+        return entradas
+
+    def __len__(self):
+        return self._total_segmentos + len(self._pendientes)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("índice fuera del log de salida")
+        if indice >= self._total_segmentos:
+            return self._pendientes[indice - self._total_segmentos]
+        numero = bisect.bisect_right(self._inicios, indice) - 1
+        return self._leer_segmento(numero)[indice - self._inicios[numero]]
+
+    def __iter__(self):
+        for numero in range(len(self._segmentos)):
+            yield from self._leer_segmento(numero)
+        yield from self._pendientes
+
+    def segmentos_en_disco(self):
+        """
+        Obtiene la cantidad de segmentos volcados a disco.
+
+        Returns:
+            int: Segmentos en el archivo temporal
+        """
+        return len(self._segmentos)
+
+    def cerrar(self):
+        """Elimina el archivo temporal y descarta las entradas."""
+        if self._archivo is not None:
+            self._archivo.close()
+            self._archivo = None
+        self._pendientes = []
+        self._bytes_pendientes = 0
+        self._segmentos = []
+        self._inicios = []
+        self._total_segmentos = 0
+        self._residentes.clear()
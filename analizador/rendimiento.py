@@ -0,0 +1,289 @@
+"""
+Búsqueda de entradas patológicas y verificación de tiempo por byte.
+
+Las entradas se describen con un patrón corto que se repite hasta el
+tamaño deseado, de modo que el corpus de regresión ocupa poco espacio y
+el mismo caso puede medirse a distintos tamaños para comprobar que el
+análisis es lineal. Un hueco {N} en el patrón se reemplaza en cada
+repetición por un identificador de N caracteres que no apareció antes,
+para que la tabla de símbolos siga creciendo con la entrada.
+
+Uso:
+    python -m analizador.rendimiento buscar [--iteraciones N] [--semilla S]
+    python -m analizador.rendimiento verificar [--limite NS] [modulo:Fabrica]
+"""
+
+import argparse
+import itertools
+import json
+import os
+import random
+import re
+import string
+import time
+
+from analizador.diferencial import OPERADORES, PALABRAS, cargar_fabrica, mutar_linea
+from analizador.lexico import Lexico
+
+
+RUTA_CORPUS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           'entradas', 'corpus_rendimiento.jsonl')
+
+# Patrones iniciales conocidos por recorrer caminos costosos del analizador
+PATRONES_INICIALES = {
+    'identificador_largo': 'a',
+    'cadena_sin_cerrar': '"x',
+    'operadores_alternados': '&|',
+    'reservada_dos_caracteres': 'si',
+    'comillas': '"',
+    'puntos_y_digitos': '.5',
+    'identificadores_distintos': '{3} ',
+    'identificadores_dos_caracteres': '{2} ',
+}
+
+# Longitudes de identificadores nuevos que la búsqueda inserta como huecos
+LONGITUDES_HUECO = (1, 2, 3, 8)
+
+HUECO = re.compile(r'\{(\d+)\}')
+
+# Primer carácter y siguientes de los identificadores generados; las letras
+# no ASCII amplían la cantidad de identificadores cortos distintos
+PRIMEROS = string.ascii_letters + '_' + ''.join(
+    c for c in map(chr, range(0xC0, 0x250)) if c.isalpha())
+SIGUIENTES = PRIMEROS + string.digits
+
+TAMANO_MEDICION = 20000
+LIMITE_NS_POR_BYTE = 20000
+LIMITE_CRECIMIENTO = 2.5
+
+
+def identificadores_nuevos(longitud):
+    """
+    Genera identificadores distintos de la longitud indicada; al agotarlos
+    vuelve a empezar.
+
+    Args:
+        longitud (int): Cantidad de caracteres de cada identificador
+
+    Yields:
+        str: Identificador
+    """
+    while True:
+        for caracteres in itertools.product(PRIMEROS, *[SIGUIENTES] * (longitud - 1)):
+            yield ''.join(caracteres)
+
+
+def expandir(patron, tamano):
+    """
+    Repite un patrón hasta alcanzar el tamaño indicado. Cada hueco {N} se
+    reemplaza en cada repetición por un identificador nuevo de N caracteres.
+
+    Args:
+        patron (str): Patrón a repetir; puede contener saltos de línea y huecos {N}
+        tamano (int): Tamaño mínimo en caracteres
+
+    Returns:
+        list: Líneas de la entrada
+    """
+    partes = HUECO.split(patron)
+    if len(partes) == 1:
+        texto = patron * (tamano // len(patron) + 1)
+        return texto.split('\n')
+
+    generadores = {}
+    for longitud in partes[1::2]:
+        generadores.setdefault(longitud, identificadores_nuevos(max(int(longitud), 1)))
+    trozos = []
+    total = 0
+    while total <= tamano:
+        for i, parte in enumerate(partes):
+            trozo = next(generadores[parte]) if i % 2 else parte
+            trozos.append(trozo)
+            total += len(trozo)
+    return ''.join(trozos).split('\n')
+
+
+def medir(fabrica, lineas, repeticiones=3):
+    """
+    Mide el tiempo por byte de analizar una entrada con un motor nuevo. Se
+    usa el tiempo de CPU del proceso, que no cambia con la carga de otros
+    procesos de la máquina.
+
+    Args:
+        fabrica (callable): Fábrica del motor
+        lineas (list): Líneas a analizar
+        repeticiones (int): Mediciones a realizar; se toma la mínima
+
+    Returns:
+        float: Nanosegundos por byte
+    """
+    total = max(sum(len(linea) for linea in lineas), 1)
+    mejor = None
+    for _ in range(repeticiones):
+        motor = fabrica()
+        inicio = time.process_time()
+        for linea in lineas:
+            motor.analizarLinea(linea)
+        transcurrido = time.process_time() - inicio
+        mejor = transcurrido if mejor is None else min(mejor, transcurrido)
+    return mejor * 1e9 / total
+
+
+def _mutar_patron(rng, patron):
+    """
+    Genera una variante de un patrón.
+
+    Args:
+        rng (random.Random): Generador de números aleatorios
+        patron (str): Patrón a mutar
+
+    Returns:
+        str: Patrón mutado, de entre 1 y 16 caracteres
+    """
+    operacion = rng.randrange(4)
+    if operacion == 0:
+        nuevo = mutar_linea(rng, patron)
+    elif operacion == 1:
+        posicion = rng.randint(0, len(patron))
+        nuevo = patron[:posicion] + rng.choice(OPERADORES + PALABRAS) + patron[posicion:]
+    elif operacion == 2:
+        posicion = rng.randint(0, len(patron))
+        hueco = f"{{{rng.choice(LONGITUDES_HUECO)}}}"
+        nuevo = patron[:posicion] + hueco + patron[posicion:]
+    else:
+        nuevo = patron + patron[:rng.randint(1, len(patron))]
+    nuevo = nuevo[:16]
+    return nuevo if nuevo.strip() else patron
+
+
+def buscar_peores(fabrica=Lexico, iteraciones=200, semilla=0, cantidad=5, tamano=TAMANO_MEDICION):
+    """
+    Busca patrones que maximizan el tiempo por byte mediante
+    escalada con mutaciones a partir de los patrones iniciales.
+
+    Args:
+        fabrica (callable): Fábrica del motor a evaluar
+        iteraciones (int): Mutaciones a evaluar
+        semilla (int): Semilla del generador
+        cantidad (int): Cantidad de patrones a devolver
+        tamano (int): Tamaño de la entrada expandida usada al medir
+
+    Returns:
+        list: Tuplas (ns_por_byte, patron) ordenadas de peor a mejor
+    """
+    rng = random.Random(semilla)
+    evaluados = {}
+    for patron in PATRONES_INICIALES.values():
+        evaluados[patron] = medir(fabrica, expandir(patron, tamano), repeticiones=1)
+
+    for _ in range(iteraciones):
+        peores = sorted(evaluados, key=evaluados.get, reverse=True)[:cantidad]
+        candidato = _mutar_patron(rng, rng.choice(peores))
+        if candidato not in evaluados:
+            evaluados[candidato] = medir(fabrica, expandir(candidato, tamano), repeticiones=1)
+
+    peores = sorted(evaluados, key=evaluados.get, reverse=True)[:cantidad]
+    return sorted(((medir(fabrica, expandir(p, tamano)), p) for p in peores), reverse=True)
+
+
+def cargar_corpus(ruta=RUTA_CORPUS):
+    """
+    Carga el corpus de regresión de rendimiento.
+
+    Args:
+        ruta (str): Ruta del archivo JSONL del corpus
+
+    Returns:
+        dict: Nombre del caso -> patrón
+    """
+    corpus = dict(PATRONES_INICIALES)
+    if os.path.exists(ruta):
+        with open(ruta, encoding='utf-8') as f:
+            for linea in f:
+                if linea.strip():
+                    caso = json.loads(linea)
+                    corpus[caso['nombre']] = caso['patron']
+    return corpus
+
+
+def guardar_corpus(patrones, ruta=RUTA_CORPUS):
+    """
+    Agrega patrones encontrados al corpus de regresión.
+
+    Args:
+        patrones (list): Patrones a agregar
+        ruta (str): Ruta del archivo JSONL del corpus
+    """
+    conocidos = set(cargar_corpus(ruta).values())
+    with open(ruta, 'a', encoding='utf-8') as f:
+        for patron in patrones:
+            if patron in conocidos:
+                continue
+            conocidos.add(patron)
+            caso = {'nombre': f"busqueda_{len(conocidos)}", 'patron': patron}
+            f.write(json.dumps(caso, ensure_ascii=False) + '\n')
+
+
+def verificar_corpus(fabrica=Lexico, corpus=None, limite=LIMITE_NS_POR_BYTE,
+                     crecimiento=LIMITE_CRECIMIENTO, tamano=TAMANO_MEDICION, repeticiones=3):
+    """
+    Verifica cada caso del corpus contra el límite de tiempo por byte y
+    comprueba que el tiempo por byte no crezca al cuadruplicar la entrada.
+
+    Args:
+        fabrica (callable): Fábrica del motor a verificar
+        corpus (dict, optional): Nombre -> patrón; por defecto el corpus guardado
+        limite (float): Máximo de nanosegundos por byte
+        crecimiento (float): Máximo cociente entre el tiempo por byte a 4x y a 1x
+        tamano (int): Tamaño base de la entrada
+        repeticiones (int): Mediciones por tamaño; se toma la mínima
+
+    Returns:
+        list: Descripciones de los casos que exceden los límites
+    """
+    if corpus is None:
+        corpus = cargar_corpus()
+
+    fallos = []
+    for nombre, patron in corpus.items():
+        base = medir(fabrica, expandir(patron, tamano), repeticiones)
+        grande = medir(fabrica, expandir(patron, tamano * 4), repeticiones)
+        if grande > limite:
+            fallos.append(f"{nombre}: {grande:.0f} ns/byte supera el límite de {limite:.0f}")
+        if grande > base * crecimiento:
+            fallos.append(f"{nombre}: el tiempo por byte crece de {base:.0f} a {grande:.0f} ns (no lineal)")
+    return fallos
+
+
+def main():
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Fuzzing de rendimiento del analizador léxico.")
+    subparsers = parser.add_subparsers(dest='comando', required=True)
+
+    buscar = subparsers.add_parser('buscar', help="Busca entradas costosas y las agrega al corpus")
+    buscar.add_argument('motor', nargs='?', default='analizador.lexico:Lexico')
+    buscar.add_argument('--iteraciones', type=int, default=500)
+    buscar.add_argument('--semilla', type=int, default=0)
+
+    verificar = subparsers.add_parser('verificar', help="Verifica el corpus contra el límite")
+    verificar.add_argument('motor', nargs='?', default='analizador.lexico:Lexico')
+    verificar.add_argument('--limite', type=float, default=LIMITE_NS_POR_BYTE)
+
+    args = parser.parse_args()
+    fabrica = cargar_fabrica(args.motor)
+
+    if args.comando == 'buscar':
+        peores = buscar_peores(fabrica, iteraciones=args.iteraciones, semilla=args.semilla)
+        for ns_por_byte, patron in peores:
+            print(f"{ns_por_byte:10.0f} ns/byte  {patron!r}")
+        guardar_corpus([patron for _, patron in peores])
+        return
+
+    fallos = verificar_corpus(fabrica, limite=args.limite)
+    for fallo in fallos:
+        print(fallo)
+    raise SystemExit(1 if fallos else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+import csv
+import gzip
+import io
+import json
+import os
+import queue
+import threading
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+TAMANO_BUFFER = 1 << 16
+SUFIJO_TEMPORAL = '.tmp'
+
+
+def formatear_entrada(token, lexema, tipo):
+    """
+    Da formato a una entrada del log de salida.
+
+    Args:
+        token (str): Token reconocido
+        lexema (str): Lexema asociado
+        tipo (str): Tipo del token
+
+    Returns:
+        str: Entrada con el formato de salida.txt
+    """
+    return f"Token: {token}, Lexema: {lexema}, Tipo: {tipo}"
+
+
+def abrir_archivo(ruta, compresion=None, newline=None):
+    """
+    Abre un archivo de texto para escritura con buffer y compresión opcional.
+
+    Args:
+        ruta (str): Ruta del archivo
+        compresion (str or None): None, 'gzip' o 'zstd'
+        newline (str or None): Traducción de saltos de línea (como en open)
+
+    Returns:
+        io.TextIOBase: Archivo de texto abierto para escritura
+    """
+    if compresion is None:
+        return open(ruta, 'w', encoding='utf-8', buffering=TAMANO_BUFFER, newline=newline)
+    if compresion == 'gzip':
+        return gzip.open(ruta, 'wt', encoding='utf-8', newline=newline)
+    if compresion == 'zstd':
+        if zstandard is None:
+            raise RuntimeError("La compresión 'zstd' requiere el paquete zstandard")
+        crudo = open(ruta, 'wb')
+        comprimido = zstandard.ZstdCompressor().stream_writer(crudo, closefd=True)
+        return io.TextIOWrapper(io.BufferedWriter(comprimido, TAMANO_BUFFER), encoding='utf-8', newline=newline)
+    raise ValueError(f"Compresión no soportada: {compresion}")
+
+
+class SalidaArchivo:
+    """
+    Base de las salidas a archivo. Se escribe en <ruta>.tmp y el archivo de
+    destino se reemplaza solo al cerrar, de modo que un análisis fallido
+    no pisa la salida anterior.
+    """
+
+    newline = None
+
+    def __init__(self, ruta, compresion=None):
+        """
+        Abre el archivo temporal de la salida.
+
+        Args:
+            ruta (str): Ruta del archivo de salida
+            compresion (str or None): None, 'gzip' o 'zstd'
+        """
+        self.ruta = ruta
+        self._temporal = ruta + SUFIJO_TEMPORAL
+        self._archivo = abrir_archivo(self._temporal, compresion, newline=self.newline)
+
+    def cerrar(self):
+        """Vacía el buffer, cierra el archivo y reemplaza el de destino."""
+        if self._archivo.closed:
+            return
+        self._archivo.close()
+        os.replace(self._temporal, self.ruta)
+
+    def descartar(self):
+        """Cierra y elimina el archivo temporal sin tocar el de destino."""
+        if self._archivo.closed:
+            return
+        try:
+            self._archivo.close()
+        finally:
+            if os.path.exists(self._temporal):
+                os.remove(self._temporal)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, *exc):
+        if tipo is None:
+            self.cerrar()
+        else:
+            self.descartar()
+
+
+class SalidaTexto(SalidaArchivo):
+    """
+    Escribe los tokens con el mismo formato de salida.txt,
+    una entrada por línea y sin salto de línea final.
+    """
+
+    def __init__(self, ruta, compresion=None):
+        """
+        Inicializa la salida de texto.
+
+        Args:
+            ruta (str): Ruta del archivo de salida
+            compresion (str or None): None, 'gzip' o 'zstd'
+        """
+        super().__init__(ruta, compresion)
+        self._separador = ''
+
+    def escribir(self, token, lexema, tipo):
+        """
+        Escribe una entrada del log.
+
+        Args:
+            token (str): Token reconocido
+            lexema (str): Lexema asociado
+            tipo (str): Tipo del token
+        """
+        self._archivo.write(self._separador + formatear_entrada(token, lexema, tipo))
+        self._separador = '\n'
+
+
+class SalidaJSONL(SalidaTexto):
+    """Escribe cada token como un objeto JSON por línea."""
+
+    def escribir(self, token, lexema, tipo):
+        """
+        Escribe una entrada como objeto JSON.
+
+        Args:
+            token (str): Token reconocido
+            lexema (str): Lexema asociado
+            tipo (str): Tipo del token
+        """
+        registro = {'token': token, 'lexema': lexema, 'tipo': tipo}
+        self._archivo.write(json.dumps(registro, ensure_ascii=False) + '\n')
+
+
+class SalidaCSV(SalidaArchivo):
+    """Escribe los tokens como filas CSV con encabezado token,lexema,tipo."""
+
+    newline = ''
+
+    def __init__(self, ruta, compresion=None):
+        """
+        Inicializa la salida CSV.
+
+        Args:
+            ruta (str): Ruta del archivo de salida
+            compresion (str or None): None, 'gzip' o 'zstd'
+        """
+        super().__init__(ruta, compresion)
+        self._escritor = csv.writer(self._archivo)
+        self._escritor.writerow(('token', 'lexema', 'tipo'))
+
+    def escribir(self, token, lexema, tipo):
+        """
+        Escribe una fila con la entrada.
+
+        Args:
+            token (str): Token reconocido
+            lexema (str): Lexema asociado
+            tipo (str): Tipo del token
+        """
+        self._escritor.writerow((token, lexema, tipo))
+
+
+class EscritorAsincrono:
+    """
+    Envuelve una salida y escribe en un hilo de fondo.
+    Los tokens se agrupan en lotes y se envían por una cola acotada,
+    de modo que el análisis y la escritura se solapan sin que la
+    memoria crezca más allá de la capacidad de la cola.
+    """
+
+    _FIN = object()
+
+    def __init__(self, salida, capacidad=64, tamano_lote=512):
+        """
+        Inicializa el escritor y arranca el hilo de escritura.
+
+        Args:
+            salida: Salida con métodos escribir(token, lexema, tipo) y cerrar()
+            capacidad (int): Máximo de lotes pendientes en la cola
+            tamano_lote (int): Tokens por lote
+        """
+        self.salida = salida
+        self.tamano_lote = tamano_lote
+        self._cola = queue.Queue(maxsize=capacidad)
+        self._lote = []
+        self._error = None
+        self._cerrado = False
+        self._descartado = False
+        self._hilo = threading.Thread(target=self._escribir_en_fondo, daemon=True)
+        self._hilo.start()
+
+    def escribir(self, token, lexema, tipo):
+        """
+        Encola una entrada para su escritura.
+
+        Args:
+            token (str): Token reconocido
+            lexema (str): Lexema asociado
+            tipo (str): Tipo del token
+        """
+        if self._error:
+            raise self._error
+        self._lote.append((token, lexema, tipo))
+        if len(self._lote) >= self.tamano_lote:
+            self._cola.put(self._lote)
+            self._lote = []
+
+    def cerrar(self):
+        """
+        Envía las entradas pendientes, espera al hilo y cierra la salida.
+        Relanza cualquier error ocurrido durante la escritura.
+        """
+        if self._cerrado:
+            return
+        self._cerrado = True
+        if self._lote:
+            self._cola.put(self._lote)
+            self._lote = []
+        self._cola.put(self._FIN)
+        self._hilo.join()
+        try:
+            self.salida.cerrar()
+        except Exception as e:
+            self._error = self._error or e
+        if self._error:
+            raise self._error
+
+    def descartar(self):
+        """
+        Detiene la escritura sin vaciar las entradas pendientes y descarta
+        la salida, si esta lo admite; si no, la cierra.
+        """
+        if self._cerrado:
+            return
+        self._cerrado = True
+        self._descartado = True
+        self._lote = []
+        self._cola.put(self._FIN)
+        self._hilo.join()
+        if hasattr(self.salida, 'descartar'):
+            self.salida.descartar()
+        else:
+            self.salida.cerrar()
+
+    def _escribir_en_fondo(self):
+        """Consume lotes de la cola hasta recibir la marca de fin."""
+        while True:
+            lote = self._cola.get()
+            if lote is self._FIN:
+                return
+            if self._error or self._descartado:
+                continue
+            try:
+                for registro in lote:
+                    self.salida.escribir(*registro)
+            except Exception as e:
+                self._error = e
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, *exc):
+        if tipo is None:
+            self.cerrar()
+        else:
+            self.descartar()
@@ -0,0 +1,326 @@
+"""
+Modo vigilancia: vuelve a analizar solo los archivos modificados de un directorio.
+
+Los cambios se detectan por sondeo (fecha de modificación y tamaño, y un
+hash del contenido para descartar cambios que no alteran el archivo), sin
+depender de servicios del sistema operativo. La salida de cada archivo
+se escribe junto a él como <nombre>.salida.txt, con el formato de salida.txt.
+
+Uso:
+    python -m analizador.vigilancia entradas/ [--patron *.txt] [--intervalo S] [--espera S] [--procesos N]
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from analizador.lexico import Lexico
+from analizador.salidas import SUFIJO_TEMPORAL, SalidaTexto
+
+
+SUFIJO_SALIDA = '.salida.txt'
+
+
+def ruta_salida(ruta):
+    """
+    Obtiene la ruta del archivo de salida de un archivo de entrada.
+
+    Args:
+        ruta (str): Ruta del archivo de entrada
+
+    Returns:
+        str: Ruta del archivo de salida
+    """
+    return os.path.splitext(ruta)[0] + SUFIJO_SALIDA
+
+
+def es_salida(nombre):
+    """
+    Indica si un nombre de archivo corresponde a una salida del analizador.
+
+    Args:
+        nombre (str): Nombre del archivo
+
+    Returns:
+        bool: True si es salida.txt o <nombre>.salida.txt, o su archivo temporal
+    """
+    nombre = nombre[:-len(SUFIJO_TEMPORAL)] if nombre.endswith(SUFIJO_TEMPORAL) else nombre
+    return nombre == 'salida.txt' or nombre.endswith(SUFIJO_SALIDA)
+
+
+def calcular_hash(ruta):
+    """
+    Calcula el hash del contenido de un archivo.
+
+    Args:
+        ruta (str): Ruta del archivo
+
+    Returns:
+        str: Hash hexadecimal del contenido
+    """
+    resumen = hashlib.blake2b(digest_size=16)
+    with open(ruta, 'rb') as f:
+        for bloque in iter(lambda: f.read(1 << 16), b''):
+            resumen.update(bloque)
+    return resumen.hexdigest()
+
+
+def analizar_archivo(ruta):
+    """
+    Analiza un archivo y escribe su salida junto a él. Si el análisis falla
+    se conserva la salida anterior.
+
+    Args:
+        ruta (str): Ruta del archivo de entrada
+
+    Returns:
+        list: Lexemas de los identificadores del archivo
+    """
+    with SalidaTexto(ruta_salida(ruta)) as salida:
+        lexico = Lexico(salidas=[salida])
+        with open(ruta, 'r', encoding='utf-8') as f:
+            for linea in f:
+                linea = linea.rstrip('\n')
+                if linea.strip():
+                    lexico.analizarLinea(linea)
+                    lexico.limpiar_log()
+    return [s.lexema for s in lexico.obtener_tabla_simbolos() if not s.palabraReservada]
+
+
+def _resultado(funcion, *args):
+    """
+    Ejecuta una función capturando su error.
+
+    Args:
+        funcion (callable): Función a ejecutar
+        *args: Argumentos de la función
+
+    Returns:
+        tuple: (resultado, None) o (None, descripción del error)
+    """
+    try:
+        return funcion(*args), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+class Vigilante:
+    """
+    Sondea un directorio y vuelve a analizar los archivos cuyo contenido
+    cambió, manteniendo un índice agregado lexema -> archivos.
+    """
+
+    def __init__(self, directorio, patron='*.txt', intervalo=1.0, espera=0.5, procesos=None):
+        """
+        Inicializa el vigilante.
+
+        Args:
+            directorio (str): Directorio a vigilar (se recorre recursivamente)
+            patron (str): Patrón de nombres de archivo a analizar
+            intervalo (float): Segundos entre sondeos
+            espera (float): Segundos que un archivo debe permanecer sin cambios
+                antes de analizarse, para agrupar ráfagas de guardados
+            procesos (int, optional): Procesos de trabajo; 0 analiza en este proceso
+        """
+        self.directorio = directorio
+        self.patron = patron
+        self.intervalo = intervalo
+        self.espera = espera
+        self.procesos = procesos
+        self.estados = {}
+        self.pendientes = {}
+        self.indice = {}
+        self.fallidos = {}
+        self._fallos = {}
+        self._identificadores = {}
+        self._ejecutor = None
+
+    def explorar(self):
+        """
+        Recorre el directorio y obtiene la firma de cada archivo a vigilar.
+
+        Returns:
+            dict: Ruta -> (fecha de modificación en ns, tamaño)
+        """
+        firmas = {}
+        for raiz, _, nombres in os.walk(self.directorio):
+            for nombre in nombres:
+                if es_salida(nombre) or not fnmatch.fnmatch(nombre, self.patron):
+                    continue
+                ruta = os.path.join(raiz, nombre)
+                try:
+                    estado = os.stat(ruta)
+                except FileNotFoundError:
+                    continue
+                firmas[ruta] = (estado.st_mtime_ns, estado.st_size)
+        return firmas
+
+    def revisar(self, ahora=None):
+        """
+        Realiza un sondeo y analiza los archivos modificados que ya cumplieron la espera.
+        Los archivos cuyo análisis falla en este sondeo quedan en self.fallidos
+        (ruta -> error), sin afectar a los demás; conservan su salida y sus
+        identificadores anteriores y se reintentan solo cuando su contenido cambia.
+
+        Args:
+            ahora (float, optional): Instante actual (time.monotonic() por defecto)
+
+        Returns:
+            list: Rutas de los archivos analizados
+        """
+        ahora = time.monotonic() if ahora is None else ahora
+        firmas = self.explorar()
+        self.fallidos = {}
+
+        for ruta in list(self.estados):
+            if ruta not in firmas:
+                del self.estados[ruta]
+                self._actualizar_indice(ruta, [])
+        for ruta in list(self.pendientes):
+            if ruta not in firmas:
+                del self.pendientes[ruta]
+        for ruta in list(self._fallos):
+            if ruta not in firmas:
+                del self._fallos[ruta]
+
+        for ruta, firma in firmas.items():
+            estado = self.estados.get(ruta)
+            fallo = self._fallos.get(ruta)
+            if (estado and estado[0] == firma) or (fallo and fallo[0] == firma):
+                self.pendientes.pop(ruta, None)
+                continue
+            pendiente = self.pendientes.get(ruta)
+            if not pendiente or pendiente[0] != firma:
+                self.pendientes[ruta] = (firma, ahora)
+
+        por_analizar = {}
+        for ruta, (firma, visto) in list(self.pendientes.items()):
+            if ahora - visto < self.espera:
+                continue
+            del self.pendientes[ruta]
+            try:
+                contenido = calcular_hash(ruta)
+            except FileNotFoundError:
+                continue
+            estado = self.estados.get(ruta)
+            fallo = self._fallos.get(ruta)
+            if estado and estado[1] == contenido:
+                self.estados[ruta] = (firma, contenido)
+                self._fallos.pop(ruta, None)
+            elif fallo and fallo[1] == contenido:
+                self._fallos[ruta] = (firma, contenido)
+            else:
+                por_analizar[ruta] = (firma, contenido)
+
+        # Un fallo se recuerda por firma y hash para no reintentar un archivo sin cambios
+        analizados = []
+        for ruta, (identificadores, error) in zip(por_analizar, self._analizar(list(por_analizar))):
+            if error is not None:
+                self.fallidos[ruta] = error
+                self._fallos[ruta] = por_analizar[ruta]
+                continue
+            self._fallos.pop(ruta, None)
+            self.estados[ruta] = por_analizar[ruta]
+            self._actualizar_indice(ruta, identificadores)
+            analizados.append(ruta)
+        return analizados
+
+    def _analizar(self, rutas):
+        """
+        Analiza los archivos, en procesos de trabajo si corresponde. El error
+        de un archivo no interrumpe el análisis de los demás.
+
+        Args:
+            rutas (list): Rutas a analizar
+
+        Returns:
+            list: Tuplas (identificadores, error) de cada archivo, en el mismo
+                orden; error es None si el análisis terminó
+        """
+        if not rutas:
+            return []
+        if self.procesos == 0:
+            return [_resultado(analizar_archivo, ruta) for ruta in rutas]
+        if self._ejecutor is None:
+            self._ejecutor = ProcessPoolExecutor(max_workers=self.procesos)
+        futuros = [self._ejecutor.submit(analizar_archivo, ruta) for ruta in rutas]
+        return [_resultado(futuro.result) for futuro in futuros]
+
+    def _actualizar_indice(self, ruta, identificadores):
+        """
+        Reemplaza en el índice agregado los identificadores de un archivo.
+
+        Args:
+            ruta (str): Ruta del archivo
+            identificadores (list): Identificadores actuales del archivo
+        """
+        for lexema in self._identificadores.pop(ruta, ()):
+            archivos = self.indice.get(lexema)
+            if archivos is not None:
+                archivos.discard(ruta)
+                if not archivos:
+                    del self.indice[lexema]
+        if identificadores:
+            self._identificadores[ruta] = frozenset(identificadores)
+            for lexema in self._identificadores[ruta]:
+                self.indice.setdefault(lexema, set()).add(ruta)
+
+    def ejecutar(self, al_analizar=None, al_fallar=None):
+        """
+        Sondea el directorio hasta que se interrumpa con Ctrl+C.
+
+        Args:
+            al_analizar (callable, optional): Recibe la lista de rutas analizadas en cada sondeo
+            al_fallar (callable, optional): Recibe el diccionario ruta -> error de
+                los archivos que fallaron en cada sondeo
+        """
+        try:
+            while True:
+                analizados = self.revisar()
+                if analizados and al_analizar:
+                    al_analizar(analizados)
+                if self.fallidos and al_fallar:
+                    al_fallar(self.fallidos)
+                time.sleep(self.intervalo)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.cerrar()
+
+    def cerrar(self):
+        """Detiene los procesos de trabajo."""
+        if self._ejecutor is not None:
+            self._ejecutor.shutdown()
+            self._ejecutor = None
+
+
+def main():
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Analiza de nuevo los archivos modificados de un directorio.")
+    parser.add_argument('directorio')
+    parser.add_argument('--patron', default='*.txt')
+    parser.add_argument('--intervalo', type=float, default=1.0)
+    parser.add_argument('--espera', type=float, default=0.5)
+    parser.add_argument('--procesos', type=int, default=None)
+    args = parser.parse_args()
+
+    vigilante = Vigilante(args.directorio, args.patron, args.intervalo, args.espera, args.procesos)
+
+    def informar(analizados):
+        for ruta in analizados:
+            print(f"Analizado: {ruta} -> {ruta_salida(ruta)}")
+        print(f"Identificadores en el índice: {len(vigilante.indice)}")
+
+    def informar_errores(fallidos):
+        for ruta, error in fallidos.items():
+            print(f"Error al analizar {ruta}: {error} (se reintentará cuando cambie)")
+
+    print(f"Vigilando {args.directorio} (Ctrl+C para salir)")
+    vigilante.ejecutar(informar, informar_errores)
+
+
+if __name__ == "__main__":
+    main()
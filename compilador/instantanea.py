@@ -0,0 +1,61 @@
+import mmap
+import os
+
+from compilador.simbolos import Simbolo
+
+
+MAGIA = b'TSIM1\n'
+
+
+def guardar_identificadores(tabla_simbolos, ruta):
+    """
+    Guarda los identificadores de una tabla de símbolos en un archivo compacto.
+    Solo se almacenan los lexemas, uno por línea y en orden de token
+    (id_1, id_2, ...); las palabras reservadas no se guardan.
+
+    Args:
+        tabla_simbolos (list): Tabla de símbolos a guardar
+        ruta (str): Ruta del archivo de instantánea
+
+    Raises:
+        ValueError: Si los tokens de los identificadores no son consecutivos
+    """
+    lexemas = []
+    for simbolo in tabla_simbolos:
+        if simbolo.palabraReservada:
+            continue
+        if simbolo.token != f"id_{len(lexemas) + 1}":
+            raise ValueError(f"Token de identificador fuera de orden: {simbolo.token}")
+        lexemas.append(simbolo.lexema)
+
+    temporal = ruta + '.tmp'
+    with open(temporal, 'wb') as f:
+        f.write(MAGIA)
+        f.write('\n'.join(lexemas).encode('utf-8'))
+    os.replace(temporal, ruta)
+
+
+def cargar_identificadores(ruta):
+    """
+    Carga los identificadores de una instantánea mapeando el archivo en memoria.
+
+    Args:
+        ruta (str): Ruta del archivo de instantánea
+
+    Returns:
+        list: Símbolos identificadores en orden de token
+
+    Raises:
+        ValueError: Si el archivo no es una instantánea válida
+    """
+    with open(ruta, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < len(MAGIA):
+            raise ValueError(f"Instantánea inválida: {ruta}")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as datos:
+            if datos[:len(MAGIA)] != MAGIA:
+                raise ValueError(f"Instantánea inválida: {ruta}")
+            contenido = datos[len(MAGIA):].decode('utf-8')
+
+    if not contenido:
+        return []
+    return [Simbolo(f"id_{i}", lexema, False) for i, lexema in enumerate(contenido.split('\n'), 1)]
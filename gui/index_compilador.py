@@ -2,9 +2,16 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import os
 from analizador.lexico import Lexico
+from analizador.salidas import EscritorAsincrono, SalidaTexto
 from gui.ventana_simbolos import VentanaSimbolos
 
 
+# Memoria máxima del log de salida antes de volcarlo a disco
+PRESUPUESTO_LOG = 64 * 1024 * 1024
+# Entradas del log que se insertan de una vez en el área de salida
+LINEAS_POR_BLOQUE = 5000
+
+
 class IndexCompilador:
     """
     Interfaz principal del analizador léxico.
@@ -155,23 +162,30 @@ class IndexCompilador:
             messagebox.showwarning("Advertencia", "No hay texto para analizar")
             return
         
-        log_salida = self._ejecutar_analisis(contenido)
-        self._actualizar_salida(log_salida)
-        self._guardar_archivo_salida(log_salida)
+        escritor, archivo_salida = self._abrir_archivo_salida()
+        try:
+            log_salida = self._ejecutar_analisis(contenido, escritor)
+            self._actualizar_salida(log_salida)
+        except Exception as e:
+            self._cerrar_archivo_salida(escritor, archivo_salida, completado=False)
+            messagebox.showerror("Error", f"Error durante el análisis: {str(e)}")
+            return
+        self._cerrar_archivo_salida(escritor, archivo_salida)
         self._actualizar_ventana_simbolos()
     
-    def _ejecutar_analisis(self, contenido):
+    def _ejecutar_analisis(self, contenido, escritor=None):
         """
         Ejecuta el análisis léxico sobre el contenido.
         
         Args:
             contenido (str): Contenido a analizar
+            escritor (EscritorAsincrono, optional): Escritor del archivo de salida
             
         Returns:
             list: Entradas del log de salida
         """
         self.lexico.limpiar_log()
-        self.lexico = Lexico()
+        self.lexico = Lexico(salidas=[escritor] if escritor else None, presupuesto_memoria=PRESUPUESTO_LOG)
         
         lineas = contenido.split('\n')
         for linea in lineas:
@@ -185,35 +199,68 @@ class IndexCompilador:
         Actualiza el área de texto de salida con los resultados del análisis.
         
         Args:
-            log_salida (list): Lista de entradas del log
+            log_salida (list): Secuencia de entradas del log
         """
         self.texto_salida.config(state=tk.NORMAL)
         self.texto_salida.delete(1.0, tk.END)
         
         if log_salida:
-            self.texto_salida.insert(1.0, '\n'.join(log_salida))
+            # Se inserta por bloques para no armar una única cadena con todo el log
+            separador = ''
+            for inicio in range(0, len(log_salida), LINEAS_POR_BLOQUE):
+                bloque = log_salida[inicio:inicio + LINEAS_POR_BLOQUE]
+                self.texto_salida.insert(tk.END, separador + '\n'.join(bloque))
+                separador = '\n'
         else:
             self.texto_salida.insert(1.0, "No se encontraron tokens")
         
         self.texto_salida.config(state=tk.DISABLED)
     
-    def _guardar_archivo_salida(self, log_salida):
+    def _abrir_archivo_salida(self):
         """
-        Guarda el log de salida en un archivo.
+        Abre el archivo de salida junto al archivo de entrada. Los tokens
+        se escriben en segundo plano mientras se realiza el análisis.
         
-        Args:
-            log_salida (list): Lista de entradas del log
+        Returns:
+            tuple: (escritor o None, ruta del archivo de salida o None)
         """
         if not self.archivo_entrada_path:
-            messagebox.showinfo("Éxito", "Análisis completado")
-            return
+            return None, None
         
         directorio = os.path.dirname(self.archivo_entrada_path)
         archivo_salida = os.path.join(directorio, 'salida.txt')
         
         try:
-            with open(archivo_salida, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(log_salida))
+            return EscritorAsincrono(SalidaTexto(archivo_salida)), archivo_salida
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al guardar archivo de salida: {str(e)}")
+            return None, None
+    
+    def _cerrar_archivo_salida(self, escritor, archivo_salida, completado=True):
+        """
+        Espera a que termine la escritura del archivo de salida e informa al usuario.
+        
+        Args:
+            escritor (EscritorAsincrono or None): Escritor del archivo de salida
+            archivo_salida (str or None): Ruta del archivo de salida
+            completado (bool): False si el análisis falló; se descarta lo escrito
+                y se conserva el archivo de salida anterior, sin informar éxito
+        """
+        if not completado:
+            if escritor:
+                try:
+                    escritor.descartar()
+                except Exception:
+                    pass
+            return
+        
+        if not escritor:
+            if not self.archivo_entrada_path:
+                messagebox.showinfo("Éxito", "Análisis completado")
+            return
+        
+        try:
+            escritor.cerrar()
             messagebox.showinfo("Éxito", f"Análisis completado. Archivo de salida guardado en:\n{archivo_salida}")
         except Exception as e:
             messagebox.showerror("Error", f"Error al guardar archivo de salida: {str(e)}")
@@ -0,0 +1,9 @@
+# Compila el escáner nativo opcional: python setup.py build_ext --inplace
+# Sin él, el analizador usa automáticamente el recorrido en Python.
+
+from setuptools import Extension, setup
+
+setup(
+    name='analizador_lexico',
+    ext_modules=[Extension('analizador._escaner', ['analizador/_escaner.c'], optional=True)],
+)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Pruebas de la caché de líneas repetidas.
+"""
+
+import functools
+import random
+
+from analizador.diferencial import comparar_motores, generar_linea
+from analizador.lexico import Lexico
+
+
+def _casos_repetitivos(semilla, cantidad):
+    rng = random.Random(semilla)
+    casos = []
+    for _ in range(cantidad):
+        lineas = [generar_linea(rng) for _ in range(4)]
+        casos.append([rng.choice(lineas) for _ in range(20)])
+    return casos
+
+
+def test_cache_equivalente_sin_cache():
+    """Con caché la salida y la tabla coinciden con el análisis normal."""
+    entradas = [
+        ["abc ab", "abc ab", "x", "abc ab"],
+        ["leer a;", "c = a + b;", "leer a;", "c = a + b;"],
+    ] + _casos_repetitivos(4, 300)
+    resultado = comparar_motores(functools.partial(Lexico, cache_lineas=2), casos=200, semilla=5,
+                                 entradas=entradas)
+    assert resultado.divergencia is None, str(resultado.divergencia)
+
+
+def test_contadores_de_cache():
+    """Los contadores reflejan los aciertos en líneas repetidas."""
+    lexico = Lexico(cache_lineas=16)
+    for _ in range(100):
+        lexico.analizarLinea("leer a;")
+        lexico.analizarLinea("c = a + b;")
+
+    estadisticas = lexico.estadisticas_cache()
+    assert estadisticas['fallos'] == 2
+    assert estadisticas['aciertos'] == 198
+    assert estadisticas['entradas'] == 2
+    assert lexico.obtener_log_salida()[-6:] == [
+        "Token: id_2, Lexema: c, Tipo: Identificador",
+        "Token: =, Lexema: =, Tipo: Palabra Reservada",
+        "Token: id_1, Lexema: a, Tipo: Identificador",
+        "Token: +, Lexema: +, Tipo: Palabra Reservada",
+        "Token: id_3, Lexema: b, Tipo: Identificador",
+        "Token: ;, Lexema: ;, Tipo: Palabra Reservada",
+    ]
+
+
+if __name__ == "__main__":
+    test_cache_equivalente_sin_cache()
+    test_contadores_de_cache()
+    print("OK")
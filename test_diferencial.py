@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Pruebas del arnés diferencial entre motores léxicos.
+"""
+
+from analizador.diferencial import comparar_motores
+from analizador.lexico import Lexico
+from compilador.simbolos import Simbolo
+
+
+class LexicoCadenaAbierta(Lexico):
+    """Motor defectuoso: acepta cadenas sin comilla de cierre."""
+
+    def _procesar_lexema_no_reservado(self, lexema, categoria=None):
+        if lexema.startswith('"'):
+            self._procesar_cadena(lexema)
+        else:
+            super()._procesar_lexema_no_reservado(lexema, categoria)
+
+
+class LexicoTablaDistinta(Lexico):
+    """Motor defectuoso: guarda en la tabla un token distinto del registrado en el log."""
+
+    def _agregar_identificador(self, lexema):
+        super()._agregar_identificador(lexema)
+        simbolo = self.tabla_simbolos[-1]
+        self.tabla_simbolos[-1] = Simbolo(simbolo.token.upper(), simbolo.lexema, False)
+
+
+def test_motor_identico_no_diverge():
+    """Lexico comparado consigo mismo no produce divergencias."""
+    resultado = comparar_motores(Lexico, casos=300, semilla=1)
+    assert resultado.divergencia is None
+    assert resultado.casos == 300
+
+
+def test_divergencia_minimizada():
+    """Un motor defectuoso se detecta y el reproductor queda reducido."""
+    resultado = comparar_motores(LexicoCadenaAbierta, casos=300, semilla=2,
+                                 entradas=[["int a;", "a = b + 5;", 'imprimir("a = , a);']])
+    divergencia = resultado.divergencia
+    assert divergencia is not None
+    assert resultado.casos == 1
+    assert divergencia.esperado == 'Token: ERROR, Lexema: "a = , a);, Tipo: No reconocido'
+    assert divergencia.obtenido == 'Token: cadena, Lexema: "a = , a);, Tipo: Cadena de Texto'
+    assert len(divergencia.reproductor) == 1
+    assert len(divergencia.reproductor[0]) == 2
+
+
+def test_divergencia_solo_en_tabla():
+    """Si solo difieren las tablas, la divergencia informa el primer símbolo distinto."""
+    resultado = comparar_motores(LexicoTablaDistinta, casos=0, entradas=[["int a;"]])
+    divergencia = resultado.divergencia
+    assert divergencia.esperado is divergencia.obtenido is None
+    assert divergencia.simbolo_esperado == ('id_1', 'a')
+    assert divergencia.simbolo_obtenido == ('ID_1', 'a')
+    assert divergencia.reproductor == ['a']
+    assert "('id_1', 'a')" in str(divergencia)
+
+
+if __name__ == "__main__":
+    test_motor_identico_no_diverge()
+    test_divergencia_minimizada()
+    test_divergencia_solo_en_tabla()
+    print("OK")
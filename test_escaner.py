@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Pruebas de conformidad del escáner nativo y del recorrido en Python.
+"""
+
+import functools
+import os
+import random
+
+import pytest
+
+from analizador import escaner
+from analizador.diferencial import comparar_motores, generar_caso
+from analizador.lexico import CATEGORIAS_NATIVAS, Lexico
+from analizador.rendimiento import LIMITE_CRECIMIENTO, expandir, medir
+
+
+requiere_nativo = pytest.mark.skipif(not escaner.NATIVO, reason="escáner nativo no compilado")
+requiere_mediciones = pytest.mark.skipif(not os.environ.get('ANALIZADOR_MEDICIONES'),
+                                         reason="mediciones de tiempo: ANALIZADOR_MEDICIONES=1")
+
+LINEAS_LIMITE = [
+    'sino simple si2 &&& ||| "" """ x',
+    'a' * 3000 + '&|' * 300 + '"' + 'x' * 500,
+    'año = ñandú + 1.5; "sin cerrar',
+    '² x² ٣٤ _9 9_ a@b "',
+    '　x\x1fy z',
+    '',
+    '   ',
+]
+
+
+def _lineas_generadas(semilla, cantidad):
+    rng = random.Random(semilla)
+    return [linea for _ in range(cantidad) for linea in generar_caso(rng)]
+
+
+def test_escanear_python_equivale_al_lexico():
+    """La referencia en Python corta los lexemas igual que Lexico."""
+    tabla = Lexico(acelerado=False)._indice_simbolos
+    lexico = Lexico(acelerado=False)
+    for linea in LINEAS_LIMITE + _lineas_generadas(6, 200):
+        esperado = list(lexico._lexemas(linea))
+        tokens = escaner.escanear_python(linea, 0, tabla)
+        assert [(inicio, linea[inicio:fin]) for _, inicio, fin in tokens] == esperado, linea
+        for tipo, inicio, fin in tokens:
+            if tipo in CATEGORIAS_NATIVAS:
+                assert CATEGORIAS_NATIVAS[tipo] == lexico._clasificar_lexema(linea[inicio:fin]), linea[inicio:fin]
+
+
+@requiere_nativo
+def test_escanear_nativo_equivale_a_python():
+    """El escáner nativo devuelve las mismas tuplas que la referencia."""
+    tabla = Lexico(acelerado=False)._indice_simbolos
+    for linea in LINEAS_LIMITE + _lineas_generadas(7, 300):
+        for inicio in (0, 1, 5):
+            assert escaner.escanear(linea, inicio, tabla) == escaner.escanear_python(linea, inicio, tabla)
+
+
+def test_recorrer_respeta_lexemas_agregados():
+    """El cursor consulta la tabla en cada paso, sin volver a escanear."""
+    recorridos = [escaner.recorrer_python]
+    if escaner.NATIVO:
+        recorridos.append(escaner.recorrer)
+    for recorrer in recorridos:
+        tabla = {}
+        cortes = []
+        for tipo, inicio, fin in recorrer('ab abc', 0, tabla):
+            cortes.append((tipo, inicio, fin))
+            tabla['ab'] = 0
+        assert cortes == [(escaner.IDENTIFICADOR, 0, 2), (escaner.DOS_CARACTERES, 3, 5),
+                          (escaner.IDENTIFICADOR, 5, 6)]
+
+
+@requiere_nativo
+@requiere_mediciones
+def test_lexico_nativo_lineal_con_identificadores_de_dos_caracteres():
+    """Una línea de identificadores de dos caracteres distintos se analiza en tiempo lineal."""
+    fabrica = functools.partial(Lexico, acelerado=True)
+    corto = medir(fabrica, expandir('{2} ', 8000), repeticiones=5)
+    largo = medir(fabrica, expandir('{2} ', 32000), repeticiones=5)
+    assert largo / corto < LIMITE_CRECIMIENTO
+
+
+@requiere_nativo
+def test_lexico_nativo_sin_divergencias():
+    """Lexico con el escáner nativo produce la misma salida que en Python."""
+    resultado = comparar_motores(functools.partial(Lexico, acelerado=True), casos=500, semilla=8,
+                                 entradas=[LINEAS_LIMITE, ["abc ab abc", "ab abc"],
+                                          expandir('{2} ', 2000)])
+    assert resultado.divergencia is None, str(resultado.divergencia)
+
+
+if __name__ == "__main__":
+    test_escanear_python_equivale_al_lexico()
+    test_recorrer_respeta_lexemas_agregados()
+    if escaner.NATIVO:
+        test_escanear_nativo_equivale_a_python()
+        test_lexico_nativo_lineal_con_identificadores_de_dos_caracteres()
+        test_lexico_nativo_sin_divergencias()
+    print("OK")
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Pruebas de las estadísticas acumuladas durante el análisis.
+"""
+
+import os
+import tempfile
+
+from analizador.estadisticas import EsbozoFrecuentes, EstadisticasLexicas, analizar_lote
+from analizador.lexico import Lexico
+
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_lote_fusiona_archivos():
+    """Las estadísticas de varios archivos se fusionan por lexema."""
+    with tempfile.TemporaryDirectory() as tmp:
+        rutas = []
+        for nombre, codigo in [('uno.txt', "int a, b;\nleer a;\n"), ('dos.txt', "b = a + @;\n\nc = b;\n")]:
+            ruta = os.path.join(tmp, nombre)
+            with open(ruta, 'w', encoding='utf-8') as f:
+                f.write(codigo)
+            rutas.append(ruta)
+        estadisticas = analizar_lote(rutas, procesos=1)
+
+    assert estadisticas.lineas == 4
+    assert estadisticas.tokens == 18
+    assert estadisticas.errores == 1
+    assert estadisticas.identificadores == {'a': 3, 'b': 3, 'c': 1}
+    assert estadisticas.reservadas[';'] == 4
+    assert estadisticas.por_tipo['Identificador'] == 7
+    assert estadisticas.archivos[rutas[1]]['errores'] == 1
+    assert 'Errores por cada 1000 tokens' in estadisticas.reporte()
+
+
+def test_lote_en_procesos_con_esbozo():
+    """El análisis en procesos con esbozo encuentra los identificadores frecuentes."""
+    ruta = os.path.join(DIRECTORIO, 'entradas', 'texto.txt')
+    estadisticas = analizar_lote([ruta, ruta], procesos=2, capacidad_esbozo=2)
+    principales = [lexema for lexema, _ in estadisticas.identificadores.most_common(3)]
+    assert set(principales) <= {'a', 'b', 'c'}
+    assert estadisticas.tokens == 2 * 42
+
+
+def test_objeto_compartido_resume_cada_archivo():
+    """Con un mismo objeto para varios archivos, cada resumen cuenta solo su archivo."""
+    estadisticas = EstadisticasLexicas()
+    for ruta, linea in [('uno.txt', "int a, b;"), ('dos.txt', "b = a + @;")]:
+        lexico = Lexico(estadisticas=estadisticas)
+        lexico.analizarLinea(linea)
+        estadisticas.cerrar_archivo(ruta, lexico.obtener_tabla_simbolos())
+
+    assert estadisticas.archivos['uno.txt'] == {'tokens': 5, 'errores': 0, 'lineas': 1, 'bytes': 9}
+    assert estadisticas.archivos['dos.txt'] == {'tokens': 6, 'errores': 1, 'lineas': 1, 'bytes': 10}
+    assert estadisticas.tokens == 11
+
+
+def test_esbozo_frecuentes():
+    """El esbozo conserva los elementos frecuentes con memoria acotada."""
+    esbozo = EsbozoFrecuentes(3)
+    for i in range(1000):
+        esbozo.agregar('x' if i % 2 else f"raro{i}")
+    assert len(esbozo.cuentas) <= 6
+    assert esbozo.most_common(1)[0][0] == 'x'
+
+
+if __name__ == "__main__":
+    test_lote_fusiona_archivos()
+    test_lote_en_procesos_con_esbozo()
+    test_objeto_compartido_resume_cada_archivo()
+    test_esbozo_frecuentes()
+    print("OK")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Pruebas del índice de identificadores entre archivos.
+"""
+
+import os
+import tempfile
+
+from analizador.indice import IndiceIdentificadores, indexar_archivos
+
+
+def _escribir(ruta, contenido):
+    with open(ruta, 'w', encoding='utf-8') as f:
+        f.write(contenido)
+
+
+def test_indice_posiciones_y_nuevos():
+    """El índice guarda las posiciones y qué archivo introdujo cada identificador."""
+    with tempfile.TemporaryDirectory() as tmp:
+        uno = os.path.join(tmp, 'uno.txt')
+        dos = os.path.join(tmp, 'dos.txt')
+        _escribir(uno, "int a, b;\n\n  leer a;\n")
+        _escribir(dos, "c = a+b;\n")
+        base = os.path.join(tmp, 'indice.db')
+
+        with IndiceIdentificadores(base) as indice:
+            tabla = indexar_archivos(indice, [uno, dos])
+        assert [s.token for s in tabla.simbolos if not s.palabraReservada] == ['id_1', 'id_2', 'id_3']
+
+        with IndiceIdentificadores(base) as indice:
+            assert indice.buscar('a') == sorted([(uno, 1, 5), (uno, 3, 8), (dos, 1, 5)])
+            assert indice.archivos_con_nuevos() == {uno: ['a', 'b'], dos: ['c']}
+
+            _escribir(dos, "x = 1;\n")
+            indexar_archivos(indice, [dos], tabla)
+            assert indice.buscar('a') == [(uno, 1, 5), (uno, 3, 8)]
+            assert indice.buscar('x') == [(dos, 1, 1)]
+
+            indice.eliminar_archivo(uno)
+            assert indice.buscar('a') == []
+            assert indice.archivos_con_nuevos() == {dos: ['x']}
+
+
+def test_reindexar_conserva_nuevos():
+    """Volver a indexar con la tabla acumulada no borra qué identificadores introdujo el archivo."""
+    with tempfile.TemporaryDirectory() as tmp:
+        uno = os.path.join(tmp, 'uno.txt')
+        _escribir(uno, "int a, b;\n")
+        with IndiceIdentificadores() as indice:
+            tabla = indexar_archivos(indice, [uno])
+            assert indice.archivos_con_nuevos() == {uno: ['a', 'b']}
+
+            indexar_archivos(indice, [uno], tabla)
+            assert indice.archivos_con_nuevos() == {uno: ['a', 'b']}
+
+            _escribir(uno, "int b, c;\n")
+            indexar_archivos(indice, [uno], tabla)
+            assert indice.archivos_con_nuevos() == {uno: ['b', 'c']}
+            assert indice.buscar('a') == []
+
+
+def test_reindexar_sin_tabla_no_atribuye_identificadores_ajenos():
+    """Sin la tabla acumulada, los identificadores de otros archivos no figuran como nuevos."""
+    with tempfile.TemporaryDirectory() as tmp:
+        uno = os.path.join(tmp, 'uno.txt')
+        dos = os.path.join(tmp, 'dos.txt')
+        _escribir(uno, "int a, b;\n")
+        _escribir(dos, "c = a + b;\n")
+        with IndiceIdentificadores() as indice:
+            indexar_archivos(indice, [uno, dos])
+            indexar_archivos(indice, [dos])
+            assert indice.archivos_con_nuevos() == {uno: ['a', 'b'], dos: ['c']}
+
+            _escribir(dos, "c = a + d;\n")
+            indexar_archivos(indice, [dos])
+            assert indice.archivos_con_nuevos() == {uno: ['a', 'b'], dos: ['c', 'd']}
+
+
+if __name__ == "__main__":
+    test_indice_posiciones_y_nuevos()
+    test_reindexar_conserva_nuevos()
+    test_reindexar_sin_tabla_no_atribuye_identificadores_ajenos()
+    print("OK")
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Pruebas de las instantáneas de la tabla de símbolos.
+"""
+
+import os
+import tempfile
+
+from analizador.lexico import Lexico, TablaPrecargada, MODO_CONGELADO
+
+
+def _analizar(lexico, codigo):
+    for linea in codigo.split('\n'):
+        if linea.strip():
+            lexico.analizarLinea(linea)
+    return lexico.obtener_log_salida()
+
+
+def test_instantanea_conserva_ids_entre_archivos():
+    """Los identificadores precargados mantienen su token en otro archivo."""
+    lexico = Lexico()
+    _analizar(lexico, "programa sumar() {\n    int a, b, c;\n}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta = os.path.join(tmp, 'tabla.tsim')
+        lexico.guardar_tabla(ruta)
+        tabla = TablaPrecargada.desde_archivo(ruta)
+
+    assert tabla.simbolos == lexico.obtener_tabla_simbolos()
+
+    otro = Lexico(tabla_precargada=tabla)
+    log_salida = _analizar(otro, "c = total + a;")
+    assert log_salida[0] == "Token: id_4, Lexema: c, Tipo: Identificador"
+    assert log_salida[2] == "Token: id_5, Lexema: total, Tipo: Identificador"
+    assert otro.identificadores_nuevos == ['total']
+    assert len(tabla.simbolos) == len(lexico.obtener_tabla_simbolos())
+
+
+def test_modo_congelado_no_modifica_tabla():
+    """En modo congelado los identificadores nuevos se informan sin agregarse."""
+    tabla = TablaPrecargada(Lexico().obtener_tabla_simbolos())
+    lexico = Lexico(tabla_precargada=tabla, modo=MODO_CONGELADO)
+    log_salida = _analizar(lexico, "leer x;\nimprimir(x);")
+
+    assert "Token: ERROR, Lexema: x, Tipo: Identificador no registrado" in log_salida
+    assert lexico.identificadores_nuevos == ['x']
+    assert lexico.obtener_tabla_simbolos() == tabla.simbolos
+
+
+if __name__ == "__main__":
+    test_instantanea_conserva_ids_entre_archivos()
+    test_modo_congelado_no_modifica_tabla()
+    print("OK")
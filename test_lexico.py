@@ -3,6 +3,8 @@
 Script rápido para verificar que el analizador léxico funciona correctamente.
 """
 
+import os
+
 from analizador.lexico import Lexico
 
 
@@ -59,6 +61,11 @@ def test_lexico():
     print(f"Total de tokens reconocidos: {len(log_salida)}")
     print(f"Total de símbolos en tabla: {len(tabla)}")
     print("=" * 60)
+    
+    # El código de prueba es entradas/texto.txt; la salida debe coincidir con salida.txt
+    ruta_esperada = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'entradas', 'salida.txt')
+    with open(ruta_esperada, encoding='utf-8') as f:
+        assert '\n'.join(log_salida) == f.read()
 
 
 if __name__ == "__main__":
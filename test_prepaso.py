@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Pruebas del pre-paso de clasificación de caracteres.
+"""
+
+import functools
+
+from analizador.diferencial import comparar_motores
+from analizador.lexico import Lexico
+from analizador.prepaso import clasificar
+
+
+def test_clasificar():
+    """Las clases respetan str.isspace y los delimitadores del analizador."""
+    assert clasificar('si(a1) "x";\t') == b'aaoaao qaqo '
+    assert clasificar('ño "') == 'ña q'
+
+
+def test_prepaso_equivalente_al_bucle():
+    """El pre-paso produce exactamente la misma salida que el bucle por carácter."""
+    lineas_largas = [
+        ['a' * 5000 + '&|' * 500 + '"' + 'x' * 1000],
+        ['sino simple si2 &&& ||| "" """ 　x\x1fy'],
+    ]
+    resultado = comparar_motores(functools.partial(Lexico, prepaso=True), casos=500, semilla=3,
+                                 entradas=lineas_largas)
+    assert resultado.divergencia is None, str(resultado.divergencia)
+
+
+if __name__ == "__main__":
+    test_clasificar()
+    test_prepaso_equivalente_al_bucle()
+    print("OK")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Pruebas del log de salida con presupuesto de memoria.
+"""
+
+from analizador.lexico import Lexico
+from analizador.registro import RegistroSalida
+
+
+def test_registro_vuelca_y_pagina():
+    """Las entradas volcadas a disco se leen de nuevo en orden."""
+    registro = RegistroSalida(presupuesto_bytes=2000, segmentos_residentes=1)
+    entradas = [f"Token: id_{i}, Lexema: v{i}, Tipo: Identificador" for i in range(500)]
+    for entrada in entradas:
+        registro.append(entrada)
+
+    assert registro.segmentos_en_disco() > 5
+    assert len(registro) == 500
+    assert list(registro) == entradas
+    assert registro[0] == entradas[0]
+    assert registro[-1] == entradas[-1]
+    assert registro[123:130] == entradas[123:130]
+    assert len(registro._residentes) == 1
+    registro.cerrar()
+    assert len(registro) == 0
+
+
+def test_lexico_con_presupuesto_igual_sin_presupuesto():
+    """El log con presupuesto de memoria produce las mismas entradas."""
+    codigo = ["int a, b, c;", "c = a + b;", 'imprimir("total", c);'] * 200
+    normal = Lexico()
+    acotado = Lexico(presupuesto_memoria=4096)
+    for linea in codigo:
+        normal.analizarLinea(linea)
+        acotado.analizarLinea(linea)
+
+    log_acotado = acotado.obtener_log_salida()
+    assert log_acotado.segmentos_en_disco() > 0
+    assert '\n'.join(log_acotado) == '\n'.join(normal.obtener_log_salida())
+    acotado.limpiar_log()
+    assert len(acotado.obtener_log_salida()) == 0
+
+
+if __name__ == "__main__":
+    test_registro_vuelca_y_pagina()
+    test_lexico_con_presupuesto_igual_sin_presupuesto()
+    print("OK")
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Pruebas de tiempo por byte sobre el corpus de entradas patológicas.
+
+Las pruebas que miden tiempo son sensibles a la carga de la máquina y solo
+se ejecutan con ANALIZADOR_MEDICIONES=1 (o ejecutando este archivo).
+"""
+
+import os
+
+import pytest
+
+from analizador.lexico import Lexico
+from analizador.rendimiento import TAMANO_MEDICION, expandir, verificar_corpus
+
+
+requiere_mediciones = pytest.mark.skipif(not os.environ.get('ANALIZADOR_MEDICIONES'),
+                                         reason="mediciones de tiempo: ANALIZADOR_MEDICIONES=1")
+
+
+class LexicoCuadratico(Lexico):
+    """Motor defectuoso: recorre todo el log por cada token."""
+
+    def _registrar(self, token, lexema, tipo):
+        super()._registrar(token, lexema, tipo)
+        '\n'.join(self.log_salida)
+
+
+class LexicoBusquedaLineal(Lexico):
+    """Motor defectuoso: busca cada lexema recorriendo la tabla completa."""
+
+    def _buscar_en_tabla(self, lexema):
+        return next((s for s in self.tabla_simbolos if s.lexema == lexema), None)
+
+
+@requiere_mediciones
+def test_corpus_dentro_del_limite():
+    """Lexico analiza todo el corpus en tiempo lineal y bajo el límite."""
+    assert verificar_corpus(Lexico, tamano=TAMANO_MEDICION, repeticiones=5) == []
+
+
+@requiere_mediciones
+def test_motor_cuadratico_detectado():
+    """Un motor cuadrático se informa como no lineal."""
+    fallos = verificar_corpus(LexicoCuadratico, corpus={'espacios': 'a '}, tamano=5000)
+    assert any('no lineal' in fallo for fallo in fallos)
+
+
+def test_huecos_generan_identificadores_nuevos():
+    """Cada hueco {N} se reemplaza por un identificador de N caracteres no usado antes."""
+    identificadores = ''.join(expandir('{2} ', 9000)).split()
+    assert len(identificadores) == len(set(identificadores)) > 2000
+    assert all(len(i) == 2 for i in identificadores)
+    assert expandir('x={1};\n', 10)[:2] == ['x=a;', 'x=b;']
+
+
+@requiere_mediciones
+def test_costo_por_crecimiento_de_tabla_detectado():
+    """Un motor cuyo costo crece con la tabla se detecta con identificadores nuevos."""
+    assert verificar_corpus(LexicoBusquedaLineal, corpus={'repetido': 'ab '}, tamano=5000) == []
+    fallos = verificar_corpus(LexicoBusquedaLineal, corpus={'nuevos': '{2} '}, tamano=5000)
+    assert any('no lineal' in fallo for fallo in fallos)
+
+
+if __name__ == "__main__":
+    test_corpus_dentro_del_limite()
+    test_motor_cuadratico_detectado()
+    test_huecos_generan_identificadores_nuevos()
+    test_costo_por_crecimiento_de_tabla_detectado()
+    print("OK")
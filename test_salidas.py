@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Pruebas de las salidas con buffer y del escritor asíncrono.
+"""
+
+import csv
+import gzip
+import importlib.util
+import json
+import os
+import tempfile
+
+import pytest
+
+from analizador.lexico import Lexico
+from analizador.salidas import EscritorAsincrono, SalidaCSV, SalidaJSONL, SalidaTexto
+
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+
+def _leer_entrada():
+    with open(os.path.join(DIRECTORIO, 'entradas', 'texto.txt'), encoding='utf-8') as f:
+        return f.read().strip().split('\n')
+
+
+def _analizar(salidas):
+    lexico = Lexico(salidas=salidas)
+    for linea in _leer_entrada():
+        if linea.strip():
+            lexico.analizarLinea(linea)
+    for salida in salidas:
+        salida.cerrar()
+    return lexico.obtener_log_salida()
+
+
+def test_salida_texto_asincrona_igual_a_salida_txt():
+    """El archivo escrito en segundo plano coincide byte a byte con salida.txt."""
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta = os.path.join(tmp, 'salida.txt')
+        log_salida = _analizar([EscritorAsincrono(SalidaTexto(ruta), tamano_lote=4)])
+        with open(ruta, 'rb') as f:
+            escrito = f.read()
+        with open(os.path.join(DIRECTORIO, 'entradas', 'salida.txt'), 'rb') as f:
+            esperado = f.read()
+    assert escrito == esperado
+    assert '\n'.join(log_salida).encode('utf-8') == esperado
+
+
+def test_salidas_jsonl_csv_y_gzip():
+    """Las salidas estructuradas contienen los mismos tokens que el log."""
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta_jsonl = os.path.join(tmp, 'salida.jsonl.gz')
+        ruta_csv = os.path.join(tmp, 'salida.csv')
+        log_salida = _analizar([
+            SalidaJSONL(ruta_jsonl, compresion='gzip'),
+            EscritorAsincrono(SalidaCSV(ruta_csv)),
+        ])
+        with gzip.open(ruta_jsonl, 'rt', encoding='utf-8') as f:
+            registros = [json.loads(linea) for linea in f]
+        with open(ruta_csv, newline='', encoding='utf-8') as f:
+            filas = list(csv.reader(f))
+
+    esperado = list(log_salida)
+    assert [f"Token: {r['token']}, Lexema: {r['lexema']}, Tipo: {r['tipo']}" for r in registros] == esperado
+    assert filas[0] == ['token', 'lexema', 'tipo']
+    assert [f"Token: {t}, Lexema: {l}, Tipo: {p}" for t, l, p in filas[1:]] == esperado
+
+
+def test_salida_fallida_conserva_archivo_anterior():
+    """Si la escritura se descarta, el archivo de salida anterior queda intacto."""
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta = os.path.join(tmp, 'salida.txt')
+        with open(ruta, 'w', encoding='utf-8') as f:
+            f.write("anterior")
+
+        escritor = EscritorAsincrono(SalidaTexto(ruta), tamano_lote=1)
+        escritor.escribir('id_1', 'a', 'Identificador')
+        escritor.descartar()
+        with pytest.raises(RuntimeError):
+            with SalidaCSV(ruta) as salida:
+                salida.escribir('id_1', 'a', 'Identificador')
+                raise RuntimeError("análisis fallido")
+
+        with open(ruta, encoding='utf-8') as f:
+            assert f.read() == "anterior"
+        assert os.listdir(tmp) == ['salida.txt']
+
+        with SalidaTexto(ruta) as salida:
+            salida.escribir('id_1', 'a', 'Identificador')
+        with open(ruta, encoding='utf-8') as f:
+            assert f.read() == "Token: id_1, Lexema: a, Tipo: Identificador"
+
+
+def test_salida_zstd():
+    """La salida comprimida con zstd se descomprime al mismo log."""
+    zstandard = pytest.importorskip('zstandard')
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta = os.path.join(tmp, 'salida.txt.zst')
+        log_salida = _analizar([EscritorAsincrono(SalidaTexto(ruta, compresion='zstd'))])
+        with open(ruta, 'rb') as f:
+            with zstandard.ZstdDecompressor().stream_reader(f) as lector:
+                escrito = lector.read()
+    assert escrito.decode('utf-8') == '\n'.join(log_salida)
+
+
+if __name__ == "__main__":
+    test_salida_texto_asincrona_igual_a_salida_txt()
+    test_salidas_jsonl_csv_y_gzip()
+    test_salida_fallida_conserva_archivo_anterior()
+    if importlib.util.find_spec('zstandard'):
+        test_salida_zstd()
+    print("OK")
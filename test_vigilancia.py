@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Pruebas del modo vigilancia.
+"""
+
+import os
+import tempfile
+
+from analizador.vigilancia import Vigilante, ruta_salida
+
+
+def _escribir(ruta, contenido):
+    with open(ruta, 'w', encoding='utf-8') as f:
+        f.write(contenido)
+
+
+def test_solo_reanaliza_archivos_modificados():
+    """Solo se analizan los archivos cuyo contenido cambió."""
+    with tempfile.TemporaryDirectory() as tmp:
+        uno = os.path.join(tmp, 'uno.txt')
+        dos = os.path.join(tmp, 'dos.txt')
+        _escribir(uno, "int a, b;\n")
+        _escribir(dos, "leer b;\n")
+        vigilante = Vigilante(tmp, espera=0, procesos=0)
+
+        assert sorted(vigilante.revisar()) == sorted([uno, dos])
+        with open(ruta_salida(uno), encoding='utf-8') as f:
+            assert f.read().split('\n')[1] == "Token: id_1, Lexema: a, Tipo: Identificador"
+        assert vigilante.indice == {'a': {uno}, 'b': {uno, dos}}
+        assert vigilante.revisar() == []
+
+        os.utime(dos, ns=(0, 0))
+        assert vigilante.revisar() == []
+
+        _escribir(uno, "int x;\n")
+        assert vigilante.revisar() == [uno]
+        assert vigilante.indice == {'x': {uno}, 'b': {dos}}
+
+        os.remove(dos)
+        vigilante.revisar()
+        assert vigilante.indice == {'x': {uno}}
+
+
+def test_espera_agrupa_guardados():
+    """Un archivo no se analiza hasta que pasa la espera sin cambios."""
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta = os.path.join(tmp, 'programa.txt')
+        _escribir(ruta, "int a;\n")
+        vigilante = Vigilante(tmp, espera=10, procesos=0)
+
+        assert vigilante.revisar(ahora=0) == []
+        _escribir(ruta, "int a, b;\n")
+        os.utime(ruta, ns=(1, 1))
+        assert vigilante.revisar(ahora=5) == []
+        assert vigilante.revisar(ahora=12) == []
+        assert vigilante.revisar(ahora=15) == [ruta]
+        assert set(vigilante.indice) == {'a', 'b'}
+
+
+def test_archivo_con_error_no_detiene_el_sondeo():
+    """Un archivo que no se puede analizar se informa, conserva su salida y se reintenta al cambiar."""
+    for procesos in (0, 1):
+        with tempfile.TemporaryDirectory() as tmp:
+            ok = os.path.join(tmp, 'ok.txt')
+            binario = os.path.join(tmp, 'bin.txt')
+            _escribir(ok, "int a;\n")
+            _escribir(binario, "int c;\n")
+            vigilante = Vigilante(tmp, espera=0, procesos=procesos)
+            try:
+                assert sorted(vigilante.revisar()) == sorted([ok, binario])
+                with open(ruta_salida(binario), encoding='utf-8') as f:
+                    salida_anterior = f.read()
+
+                with open(binario, 'wb') as f:
+                    f.write(b"int b;\n\xff\xfe\n")
+                _escribir(ok, "int a, d;\n")
+                assert vigilante.revisar() == [ok]
+                assert list(vigilante.fallidos) == [binario]
+                assert 'UnicodeDecodeError' in vigilante.fallidos[binario]
+                assert vigilante.indice == {'a': {ok}, 'd': {ok}, 'c': {binario}}
+                with open(ruta_salida(binario), encoding='utf-8') as f:
+                    assert f.read() == salida_anterior
+                assert sorted(os.listdir(tmp)) == sorted(['ok.txt', 'bin.txt', 'ok.salida.txt', 'bin.salida.txt'])
+
+                # Sin cambios de contenido no se vuelve a analizar
+                assert vigilante.revisar() == []
+                os.utime(binario, ns=(0, 0))
+                assert vigilante.revisar() == []
+                assert vigilante.fallidos == {}
+
+                _escribir(binario, "int b;\n")
+                assert vigilante.revisar() == [binario]
+                assert vigilante.fallidos == {}
+                assert vigilante.indice == {'a': {ok}, 'd': {ok}, 'b': {binario}}
+            finally:
+                vigilante.cerrar()
+
+
+if __name__ == "__main__":
+    test_solo_reanaliza_archivos_modificados()
+    test_espera_agrupa_guardados()
+    test_archivo_con_error_no_detiene_el_sondeo()
+    print("OK")